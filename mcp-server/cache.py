@@ -0,0 +1,109 @@
+import asyncio
+import functools
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+# Result handed to waiters when the call producing a value was cancelled
+_RETRY = object()
+
+
+class TTLCache:
+    """In-memory cache of formatted tool responses with a per-entry time-to-live."""
+
+    def __init__(self):
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store value under key for ttl seconds."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    async def get_or_set(self, key: Hashable, ttl: float, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, awaiting factory() to produce it on a miss.
+
+        Concurrent misses for the same key share a single factory call, so a
+        burst of identical requests only reaches the API once. Exceptions
+        raised by the factory are propagated to every waiter and not cached;
+        if the call running factory() is cancelled, waiters retry it instead.
+        A ttl of 0 only shares in-flight calls and stores nothing.
+        """
+        while True:
+            value = self.get(key)
+            if value is not None:
+                return value
+
+            pending = self._pending.get(key)
+            if pending is None:
+                break
+            value = await asyncio.shield(pending)
+            # The owning call was cancelled; re-check and run factory() ourselves
+            if value is not _RETRY:
+                return value
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            value = await factory()
+        except BaseException as e:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                # Mark the exception as retrieved in case nobody else was waiting
+                future.exception()
+            else:
+                # Cancelling the shared future would cancel every waiter too
+                future.set_result(_RETRY)
+            raise
+
+        # Only store the value if the key was not invalidated while in flight
+        if self._pending.get(key) is future:
+            del self._pending[key]
+            if ttl > 0:
+                self.set(key, value, ttl)
+
+        future.set_result(value)
+        return value
+
+    def invalidate_prefix(self, prefix: Tuple) -> None:
+        """Drop every entry whose tuple key starts with prefix.
+
+        In-flight lookups for matching keys still complete for their current
+        waiters, but their results are not stored.
+        """
+        size = len(prefix)
+        for store in (self._entries, self._pending):
+            for key in [k for k in store if isinstance(k, tuple) and k[:size] == prefix]:
+                del store[key]
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+        self._pending.clear()
+
+
+def async_cached(cache: TTLCache, ttl: float, key: Callable[..., Hashable]):
+    """Cache the result of a coroutine function in cache for ttl seconds.
+
+    key is called with the same arguments as the decorated function and must
+    return a hashable cache key. Exceptions are never cached.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await cache.get_or_set(key(*args, **kwargs), ttl, lambda: func(*args, **kwargs))
+        return wrapper
+    return decorator
@@ -1,7 +1,7 @@
 import os
-import argparse
-import dotenv
-from typing import Dict, Any
+import sys
+import functools
+from typing import Dict, Any, Tuple
 from pathlib import Path
 
 # Default configuration values
@@ -14,27 +14,57 @@ DEFAULT_CONFIG = {
     'quix_workspace': None
 }
 
+# Configuration keys read from environment variables
+_ENV_KEYS = (
+    ('quix_token', 'QUIX_TOKEN'),
+    ('quix_base_url', 'QUIX_BASE_URL'),
+    ('quix_workspace', 'QUIX_WORKSPACE'),
+)
+
 def load_config() -> Dict[str, Any]:
     """Load configuration with the following priority:
     1. Default values
     2. Environment variables
     3. .env file
     4. Command line arguments
+    
+    The result is computed once per set of command line arguments.
     """
+    return dict(_load_config(tuple(sys.argv[1:])))
+
+@functools.lru_cache(maxsize=1)
+def _load_config(argv: Tuple[str, ...]) -> Dict[str, Any]:
     # Start with default config
     config = DEFAULT_CONFIG.copy()
     
     # Load from .env file if it exists
     env_path = Path('.env')
-    if env_path.exists():
+    if env_path.is_file():
+        import dotenv
         dotenv.load_dotenv(env_path)
     
     # Update from environment variables
-    config['quix_token'] = os.environ.get('QUIX_TOKEN', config['quix_token'])
-    config['quix_base_url'] = os.environ.get('QUIX_BASE_URL', config['quix_base_url'])
-    config['quix_workspace'] = os.environ.get('QUIX_WORKSPACE', config['quix_workspace'])
+    for key, env_var in _ENV_KEYS:
+        value = os.environ.get(env_var)
+        if value is not None:
+            config[key] = value
+    
+    # Without arguments there is nothing to parse, so skip building the parser
+    if argv:
+        _apply_cli_args(config, argv)
+    
+    # Validate required configuration
+    if not config['quix_token']:
+        raise ValueError("QUIX_TOKEN must be provided via environment variable, .env file, or --quix-token argument")
+    
+    if not config['quix_workspace']:
+        raise ValueError("QUIX_WORKSPACE must be provided via environment variable, .env file, or --quix-workspace argument")
     
-    # Parse command line arguments
+    return config
+
+def _apply_cli_args(config: Dict[str, Any], argv: Tuple[str, ...]) -> None:
+    """Override config with the values given on the command line."""
+    import argparse
     parser = argparse.ArgumentParser(description='Quix Applications MCP Server')
     
     # Server configuration
@@ -47,7 +77,7 @@ def load_config() -> Dict[str, Any]:
     parser.add_argument('--quix-base-url', type=str, help='Quix Portal Base URL')
     parser.add_argument('--quix-workspace', type=str, help='Quix Workspace ID')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Update config with command line arguments if provided
     if args.host is not None:
@@ -62,12 +92,3 @@ def load_config() -> Dict[str, Any]:
         config['quix_base_url'] = args.quix_base_url.rstrip('/')
     if args.quix_workspace is not None:
         config['quix_workspace'] = args.quix_workspace
-    
-    # Validate required configuration
-    if not config['quix_token']:
-        raise ValueError("QUIX_TOKEN must be provided via environment variable, .env file, or --quix-token argument")
-    
-    if not config['quix_workspace']:
-        raise ValueError("QUIX_WORKSPACE must be provided via environment variable, .env file, or --quix-workspace argument")
-    
-    return config
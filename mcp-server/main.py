@@ -1,10 +1,15 @@
 import os
+import re
 import asyncio
+import functools
 import logging
 import httpx
+import orjson
+from contextlib import asynccontextmanager
 from enum import Enum
+from itertools import chain
 from pathlib import Path
-from typing import Any, Optional, Dict, List
+from typing import Any, Callable, Optional, Dict, List, Tuple
 
 from mcp.server.fastmcp import FastMCP, Context
 from mcp.server.sse import SseServerTransport
@@ -12,27 +17,52 @@ from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.routing import Mount, Route
 from mcp.server import Server
-import uvicorn
 
 from config import load_config
+from cache import TTLCache, async_cached
 
 
 # Initialize FastMCP server for Quix Applications
 mcp = FastMCP("quix")
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Set up logging; handlers are configured by the entry point, not on import
 logger = logging.getLogger(__name__)
 
 # Quix API constants
 DEFAULT_API_VERSION_HEADER = "2.0"
 
+# Query-string spelling of boolean parameters
+_BOOL_STR = {True: "true", False: "false"}
+
+# Cache settings (seconds)
+LIBRARY_CACHE_TTL = 300
+TOPICS_CACHE_TTL = 10
+DEFAULT_TOPIC_CONFIG_CACHE_TTL = 300
+APP_VARIABLES_CACHE_TTL = 5
+
+# Formatted responses of read-only tools, keyed by (tool_name, params)
+_response_cache = TTLCache()
+
+# Last-seen variables per application, so variable edits can skip re-fetching the application
+_app_variables_cache = TTLCache()
+
+# GET requests currently awaiting a response, so concurrent duplicates can share them
+_inflight_gets = TTLCache()
+
+# Last ETag and formatted response per cache key, for conditional GETs
+ETAG_CACHE_SIZE = 128
+_etag_responses: Dict[tuple, Tuple[str, str]] = {}
+
 # Define enums to match the schemas in the Swagger definition
 class TopicCleanupPolicy(str, Enum):
     DELETE = "Delete"
     COMPACT = "Compact"
     DELETE_AND_COMPACT = "DeleteAndCompact"
 
+# The enum's own value lookup dict gives O(1) validation without another copy
+_VALID_CLEANUP_POLICIES = TopicCleanupPolicy._value2member_map_
+_VALID_CLEANUP_POLICIES_STR = ", ".join(_VALID_CLEANUP_POLICIES)
+
 class DeploymentType(str, Enum):
     SERVICE = "Service"
     JOB = "Job"
@@ -76,6 +106,9 @@ class VariableInputType(str, Enum):
     OUTPUT_TOPIC = "OutputTopic"
     SECRET = "Secret"
 
+_VALID_INPUT_TYPES = VariableInputType._value2member_map_
+_VALID_INPUT_TYPES_STR = ", ".join(_VALID_INPUT_TYPES)
+
 class LogDirection(str, Enum):
     FORWARD = "Forward"
     BACKWARD = "Backward"
@@ -84,19 +117,46 @@ class QuixApiError(Exception):
     """Exception raised for errors in the Quix API."""
     pass
 
-async def make_quix_request(
-    ctx: Context,
-    method: str,
-    path: str,
-    json: Dict[str, Any] = None,
-    params: Dict[str, Any] = None,
-    headers: Dict[str, Any] = None,
-) -> Any:
-    """Make a request to the Quix Portal API with proper error handling."""
-    # Get environment variables
+# Shared HTTP client so successive requests reuse keep-alive connections
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use.
+    
+    The client carries the base URL and default headers, so requests only
+    pass a relative path and any extra headers.
+    """
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        base_url, _, default_headers = _api_settings()
+        limits = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0)
+        _HTTP_CLIENT = httpx.AsyncClient(
+            base_url=base_url,
+            headers=default_headers,
+            # Keep a slow TLS handshake from using up the whole request budget
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            follow_redirects=False,
+            transport=httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=0)
+        )
+    return _HTTP_CLIENT
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
+@functools.lru_cache(maxsize=None)
+def _api_settings() -> Tuple[str, Optional[str], Dict[str, str]]:
+    """Read the API connection settings from the environment once.
+    
+    Returns the base URL (with a trailing slash), the workspace ID and the
+    default request headers. Missing settings raise QuixApiError and are
+    re-checked on the next call, since exceptions are not cached.
+    """
     token = os.environ.get("QUIX_TOKEN")
     base_url = os.environ.get("QUIX_BASE_URL")
-    workspace_id = os.environ.get("QUIX_WORKSPACE")
     
     if not token:
         raise QuixApiError("Missing QUIX_TOKEN environment variable. Please set your Quix Personal Access Token.")
@@ -104,79 +164,225 @@ async def make_quix_request(
     if not base_url:
         raise QuixApiError("Missing QUIX_BASE_URL environment variable. Please set your Quix Base URL (e.g. https://portal-myenv.platform.quix.io/).")
     
-    if not workspace_id and "{workspaceId}" in path:
-        raise QuixApiError("Missing QUIX_WORKSPACE environment variable. Please set your Quix Workspace ID.")
-    
-    # Replace workspace_id in path if present
-    if workspace_id and "{workspaceId}" in path:
-        path = path.replace("{workspaceId}", workspace_id)
-    
     # Ensure base URL ends with a slash
     if not base_url.endswith('/'):
         base_url = f"{base_url}/"
     
-
-    # Set default headers
-    request_headers = {
+    default_headers = {
         "Authorization": f"bearer {token}",
         "Content-Type": "application/json",
+        # Brotli decoding needs the httpx[brotli] extra
+        "Accept-Encoding": "gzip, br",
         "X-Version": DEFAULT_API_VERSION_HEADER
     }
+    return base_url, os.environ.get("QUIX_WORKSPACE"), default_headers
+
+async def make_quix_request(
+    ctx: Context,
+    method: str,
+    path: Optional[str] = None,
+    json: Dict[str, Any] = None,
+    params: Dict[str, Any] = None,
+    headers: Dict[str, Any] = None,
+    path_parts: Optional[Tuple[str, ...]] = None,
+    return_response: bool = False,
+) -> Any:
+    """Make a request to the Quix Portal API with proper error handling.
     
-    # Add any additional headers
-    if headers:
-        request_headers.update(headers)
+    Either pass a path template, where {workspaceId} is substituted, or
+    path_parts, which are joined with "/" after the workspace ID.
+    With return_response the httpx.Response is returned instead of its
+    parsed body, so callers can inspect the status code and headers.
+    """
+    base_url, workspace_id, default_headers = _api_settings()
     
-    # Log the request details (omitting sensitive headers)
-    safe_headers = {k: v for k, v in request_headers.items() if k != "Authorization"}
-    logger.info(f"API Request: {method} {base_url}{path}")
-    logger.debug(f"Headers: {safe_headers}")
-    logger.debug(f"Params: {params}")
+    if not workspace_id and (path_parts is not None or "{workspaceId}" in path):
+        raise QuixApiError("Missing QUIX_WORKSPACE environment variable. Please set your Quix Workspace ID.")
+    
+    if path_parts is not None:
+        path = "/".join((workspace_id, *path_parts))
+    # Replace workspace_id in path if present
+    elif workspace_id:
+        path = path.replace("{workspaceId}", workspace_id, 1)
     
-    url = f"{base_url}{path}"
+    # Log the request details (omitting sensitive headers)
+    logger.info("API Request: %s %s%s", method, base_url, path)
+    if logger.isEnabledFor(logging.DEBUG):
+        request_headers = {**default_headers, **headers} if headers else default_headers
+        safe_headers = {k: v for k, v in request_headers.items() if k != "Authorization"}
+        logger.debug("Headers: %s", safe_headers)
+        logger.debug("Params: %s", params)
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method=method,
-                url=url,
-                json=json,
-                params=params,
-                headers=request_headers,
-                timeout=30.0
+        client = _get_client()
+        # The client adds the base URL and default headers (including the JSON
+        # Content-Type); payloads are serialized with orjson rather than httpx's json
+        send = functools.partial(
+            client.request,
+            method=method,
+            url=path,
+            content=orjson.dumps(json) if json is not None else None,
+            # Tools pass an empty dict when no filters are set; skip encoding it
+            params=params or None,
+            headers=headers
+        )
+        
+        if method == "GET":
+            # Identical concurrent GETs share one round-trip; each caller parses the body itself
+            key = (
+                path,
+                tuple(sorted(params.items())) if params else (),
+                tuple(sorted(headers.items())) if headers else ()
             )
-            
-            response.raise_for_status()
-            
-            # Handle empty responses
-            if not response.content:
-                return None
-            
-            return response.json()
+            response = await _inflight_gets.get_or_set(key, 0, send)
+        else:
+            response = await send()
+        
+        # Conditional requests answer 304 Not Modified, which the caller handles
+        if return_response and response.status_code == 304:
+            return response
+        
+        response.raise_for_status()
+        
+        if return_response:
+            return response
+        
+        # Nothing to parse for 204 No Content or an empty body
+        if response.status_code == 204 or response.headers.get("content-length") == "0":
+            return None
+        
+        content = await response.aread()
+        if not content:
+            return None
+        
+        # Only JSON bodies are parsed; text and binary bodies are returned as text
+        content_type = response.headers.get("content-type", "")
+        if content_type.startswith("text/"):
+            # Decoded with the charset the response declares
+            return response.text
+        if content_type.startswith("application/octet-stream"):
+            return content.decode(errors="replace")
+        
+        return orjson.loads(content)
 
     except httpx.HTTPStatusError as e:
         error_info = f"HTTP error {e.response.status_code}"
         try:
-            error_detail = e.response.json()
+            error_detail = orjson.loads(e.response.content)
             error_info = f"{error_info}: {error_detail}"
         except Exception:
             # If we can't parse JSON, use the text content
             if e.response.text:
                 error_info = f"{error_info}: {e.response.text}"
         
-        logger.error(f"API Error: {error_info}")
+        logger.error("API Error: %s", error_info)
         raise QuixApiError(f"Error calling Quix API: {error_info}")
     except httpx.RequestError as e:
-        logger.error(f"Request error: {str(e)}")
+        logger.error("Request error: %s", e)
         raise QuixApiError(f"Request error: {str(e)}")
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", e)
         raise QuixApiError(f"Unexpected error: {str(e)}")
 
 # =========================================
 # Application Tools
 # =========================================
 
+# Application endpoint templates; {workspaceId} is filled in by make_quix_request
+_APP_PATH = "{workspaceId}/applications/%s"
+_APP_FILES_PATH = "{workspaceId}/applications/%s/files"
+_APP_DUPLICATE_PATH = "{workspaceId}/applications/%s/duplicate"
+_APP_COMMITS_PATH = "{workspaceId}/applications/%s/commits"
+_APP_LAST_COMMIT_PATH = "{workspaceId}/applications/%s/commits/last"
+_APP_TAGS_PATH = "{workspaceId}/applications/%s/tags"
+
+_APP_SEPARATOR = "-" * 40 + "\n"
+
+def _remember_app_variables(
+    application_id: str,
+    application: Optional[Dict[str, Any]],
+    sent_variables: Optional[List[Dict[str, Any]]] = None
+) -> None:
+    """Store the variables an application holds after a GET or a successful PATCH.
+    
+    The variables in the response are preferred; a PATCH response without them
+    falls back to sent_variables, the list the PATCH sent. If neither is known
+    the entry is dropped, so the next lookup fetches the application.
+    """
+    variables = application.get('variables') if application else None
+    if variables is None:
+        variables = sent_variables
+    key = _workspace_cache_key(application_id)
+    if variables is None:
+        _app_variables_cache.invalidate_prefix(key)
+    else:
+        _app_variables_cache.set(key, variables, APP_VARIABLES_CACHE_TTL)
+
+async def _get_app_variables(ctx: Context, application_id: str) -> Optional[List[Dict[str, Any]]]:
+    """Return the application's current variables, or None if the application does not exist.
+    
+    Variables seen in a recent response are reused; otherwise the application is fetched.
+    """
+    variables = _app_variables_cache.get(_workspace_cache_key(application_id))
+    if variables is not None:
+        return variables
+    
+    current_app = await make_quix_request(
+        ctx, 
+        "GET", 
+        _APP_PATH % application_id
+    )
+    
+    if not current_app:
+        return None
+    
+    _remember_app_variables(application_id, current_app)
+    return current_app.get('variables') or []
+
+def _render_application_fragments(app: Dict[str, Any]):
+    """Yield the summary lines of an application in a list."""
+    yield (
+        f"ID: {app.get('applicationId')}\n"
+        f"Name: {app.get('name')}\n"
+        f"Path: {app.get('path')}\n"
+        f"Language: {app.get('language') or 'Unknown'}\n"
+    )
+    
+    # Add status information
+    status = app.get('status')
+    if status:
+        yield f"Status: {status}\n"
+        
+    # Include error information if present
+    error_status = app.get('errorStatus')
+    if error_status:
+        yield f"Error Status: {error_status}\n"
+        error_message = app.get('errorMessage')
+        if error_message:
+            yield f"Error Message: {error_message}\n"
+    
+    # Add updated_at if included in response
+    updated_at = app.get('updatedAt')
+    if updated_at:
+        yield f"Last Updated: {updated_at}\n"
+
+def _render_commit_fragments(commit: Dict[str, Any]):
+    """Yield the lines describing a commit (or the commit of a tag)."""
+    yield (
+        f"Reference: {commit.get('reference')}\n"
+        f"Message: {commit.get('message')}\n"
+        f"Created: {commit.get('createdAt')}\n"
+    )
+    
+    author_name = commit.get('authorName')
+    if author_name:
+        author_email = commit.get('authorEmail')
+        yield f"Author: {author_name} <{author_email}>\n" if author_email else f"Author: {author_name}\n"
+        
+    committer_name = commit.get('committerName')
+    if committer_name and committer_name != author_name:
+        yield f"Committer: {committer_name}\n"
+
 @mcp.tool()
 async def list_applications(ctx: Context, search: Optional[str] = None, include_updated_at: bool = False) -> str:
     """List all applications in the workspace.
@@ -202,34 +408,10 @@ async def list_applications(ctx: Context, search: Optional[str] = None, include_
         if not applications:
             return "No applications found in this workspace."
         
-        result = "Applications:\n\n"
-        for app in applications:
-            result += f"ID: {app.get('applicationId')}\n"
-            result += f"Name: {app.get('name')}\n"
-            result += f"Path: {app.get('path')}\n"
-            result += f"Language: {app.get('language') or 'Unknown'}\n"
-            
-            # Add status information
-            status = app.get('status')
-            if status:
-                result += f"Status: {status}\n"
-                
-            # Include error information if present
-            error_status = app.get('errorStatus')
-            if error_status:
-                result += f"Error Status: {error_status}\n"
-                error_message = app.get('errorMessage')
-                if error_message:
-                    result += f"Error Message: {error_message}\n"
-            
-            # Add updated_at if included in response
-            updated_at = app.get('updatedAt')
-            if updated_at:
-                result += f"Last Updated: {updated_at}\n"
-                
-            result += "-" * 40 + "\n"
-        
-        return result
+        return "".join(chain(
+            ["Applications:\n\n"],
+            chain.from_iterable(chain(_render_application_fragments(app), (_APP_SEPARATOR,)) for app in applications)
+        ))
     except QuixApiError as e:
         return f"Error: {str(e)}"
 
@@ -252,7 +434,7 @@ async def get_application(ctx: Context, application_id: str, reference: Optional
         application = await make_quix_request(
             ctx, 
             "GET", 
-            "{workspaceId}/applications/{applicationId}".replace("{applicationId}", application_id),
+            _APP_PATH % application_id,
             params=params
         )
         
@@ -260,85 +442,89 @@ async def get_application(ctx: Context, application_id: str, reference: Optional
             return f"No application found with ID {application_id}."
         
         # Format the application details
-        result = "Application Details:\n\n"
-        result += f"ID: {application.get('applicationId')}\n"
-        result += f"Name: {application.get('name')}\n"
-        result += f"Path: {application.get('path')}\n"
-        result += f"Workspace ID: {application.get('workspaceId')}\n"
-        result += f"Language: {application.get('language') or 'Unknown'}\n"
+        parts = [
+            "Application Details:\n\n"
+            f"ID: {application.get('applicationId')}\n"
+            f"Name: {application.get('name')}\n"
+            f"Path: {application.get('path')}\n"
+            f"Workspace ID: {application.get('workspaceId')}\n"
+            f"Language: {application.get('language') or 'Unknown'}\n"
+        ]
         
         # Add docker information if present
         dockerfile = application.get('dockerfile')
         if dockerfile:
-            result += f"Dockerfile: {dockerfile}\n"
+            parts.append(f"Dockerfile: {dockerfile}\n")
             
         run_entry_point = application.get('runEntryPoint')
         if run_entry_point:
-            result += f"Run Entry Point: {run_entry_point}\n"
+            parts.append(f"Run Entry Point: {run_entry_point}\n")
             
         default_file = application.get('defaultFile')
         if default_file:
-            result += f"Default File: {default_file}\n"
+            parts.append(f"Default File: {default_file}\n")
             
         # Add status information
         status = application.get('status')
         if status:
-            result += f"Status: {status}\n"
+            parts.append(f"Status: {status}\n")
             
         # Include error information if present
         error_status = application.get('errorStatus')
         if error_status:
-            result += f"Error Status: {error_status}\n"
+            parts.append(f"Error Status: {error_status}\n")
             error_message = application.get('errorMessage')
             if error_message:
-                result += f"Error Message: {error_message}\n"
+                parts.append(f"Error Message: {error_message}\n")
                 
         # Include library item ID if present
         library_item_id = application.get('libraryItemId')
         if library_item_id:
-            result += f"Library Item ID: {library_item_id}\n"
+            parts.append(f"Library Item ID: {library_item_id}\n")
             
         # Include connector and auxiliary service flags if present
         is_connector = application.get('isConnector')
         if is_connector is not None:
-            result += f"Is Connector: {is_connector}\n"
+            parts.append(f"Is Connector: {is_connector}\n")
             
         is_auxiliary_service = application.get('isAuxiliaryService')
         if is_auxiliary_service is not None:
-            result += f"Is Auxiliary Service: {is_auxiliary_service}\n"
+            parts.append(f"Is Auxiliary Service: {is_auxiliary_service}\n")
             
         # Add included folders if present
         included_folders = application.get('includedFolders')
         if included_folders:
-            result += "Included Folders:\n"
+            parts.append("Included Folders:\n")
             for folder in included_folders:
-                result += f"  - {folder}\n"
+                parts.append(f"  - {folder}\n")
                 
         # Add variables if present
         variables = application.get('variables')
         if variables:
-            result += "\nVariables:\n"
+            parts.append("\nVariables:\n")
             for var in variables:
-                result += f"  Name: {var.get('name')}\n"
-                result += f"  Type: {var.get('inputType')}\n"
-                result += f"  Required: {var.get('required')}\n"
+                parts.append(
+                    f"  Name: {var.get('name')}\n"
+                    f"  Type: {var.get('inputType')}\n"
+                    f"  Required: {var.get('required')}\n"
+                )
                 
                 description = var.get('description')
                 if description:
-                    result += f"  Description: {description}\n"
+                    parts.append(f"  Description: {description}\n")
                     
                 default_value = var.get('defaultValue')
                 if default_value:
-                    result += f"  Default Value: {default_value}\n"
+                    parts.append(f"  Default Value: {default_value}\n")
                     
-                result += "  ---\n"
+                parts.append("  ---\n")
                 
         # Add updated_at if included in response
         updated_at = application.get('updatedAt')
         if updated_at:
-            result += f"Last Updated: {updated_at}\n"
+            parts.append(f"Last Updated: {updated_at}\n")
             
-        return result
+        return "".join(parts)
     except QuixApiError as e:
         return f"Error: {str(e)}"
 
@@ -433,10 +619,12 @@ async def update_application(
         application = await make_quix_request(
             ctx, 
             "PATCH", 
-            "{workspaceId}/applications/{applicationId}".replace("{applicationId}", application_id),
+            _APP_PATH % application_id,
             json=payload
         )
         
+        _remember_app_variables(application_id, application, payload.get("variables"))
+        
         if not application:
             return f"Failed to update application {application_id}."
         
@@ -453,15 +641,17 @@ async def delete_application(ctx: Context, application_id: str, delete_files: bo
         delete_files: Whether to delete the application files (default: True)
     """
     try:
-        params = {"deleteFiles": str(delete_files).lower()}
+        params = {"deleteFiles": _BOOL_STR[delete_files]}
         
         result = await make_quix_request(
             ctx, 
             "DELETE", 
-            "{workspaceId}/applications/{applicationId}".replace("{applicationId}", application_id),
+            _APP_PATH % application_id,
             params=params
         )
         
+        _app_variables_cache.invalidate_prefix(_workspace_cache_key(application_id))
+        
         return f"Successfully deleted application with ID: {application_id}"
     except QuixApiError as e:
         return f"Error deleting application: {str(e)}"
@@ -482,18 +672,17 @@ async def list_application_files(ctx: Context, application_id: str, reference: O
         files = await make_quix_request(
             ctx, 
             "GET", 
-            "{workspaceId}/applications/{applicationId}/files".replace("{applicationId}", application_id),
+            _APP_FILES_PATH % application_id,
             params=params
         )
         
         if not files:
             return f"No files found in application {application_id}."
         
-        result = f"Files in application {application_id}:\n\n"
-        for file in files:
-            result += f"- {file}\n"
-            
-        return result
+        return "".join(chain(
+            [f"Files in application {application_id}:\n\n"],
+            (f"- {file}\n" for file in files)
+        ))
     except QuixApiError as e:
         return f"Error listing application files: {str(e)}"
 
@@ -522,7 +711,7 @@ async def duplicate_application(
         application = await make_quix_request(
             ctx, 
             "POST", 
-            "{workspaceId}/applications/{applicationId}/duplicate".replace("{applicationId}", application_id),
+            _APP_DUPLICATE_PATH % application_id,
             json=payload
         )
         
@@ -553,42 +742,23 @@ async def get_application_commits(
         if git_reference:
             params["gitReference"] = git_reference
             
-        if limit:
+        if limit is not None:
             params["limit"] = limit
             
         commits = await make_quix_request(
             ctx, 
             "GET", 
-            "{workspaceId}/applications/{applicationId}/commits".replace("{applicationId}", application_id),
+            _APP_COMMITS_PATH % application_id,
             params=params
         )
         
         if not commits:
             return f"No commit history found for application {application_id}."
         
-        result = f"Commit history for application {application_id}:\n\n"
-        for commit in commits:
-            result += f"Reference: {commit.get('reference')}\n"
-            result += f"Message: {commit.get('message')}\n"
-            result += f"Created: {commit.get('createdAt')}\n"
-            
-            author_name = commit.get('authorName')
-            if author_name:
-                result += f"Author: {author_name}"
-                
-                author_email = commit.get('authorEmail')
-                if author_email:
-                    result += f" <{author_email}>"
-                    
-                result += "\n"
-                
-            committer_name = commit.get('committerName')
-            if committer_name and committer_name != author_name:
-                result += f"Committer: {committer_name}\n"
-                
-            result += "-" * 40 + "\n"
-            
-        return result
+        return "".join(chain(
+            [f"Commit history for application {application_id}:\n\n"],
+            chain.from_iterable(chain(_render_commit_fragments(commit), (_APP_SEPARATOR,)) for commit in commits)
+        ))
     except QuixApiError as e:
         return f"Error retrieving commit history: {str(e)}"
 
@@ -603,32 +773,16 @@ async def get_application_last_commit(ctx: Context, application_id: str) -> str:
         commit = await make_quix_request(
             ctx, 
             "GET", 
-            "{workspaceId}/applications/{applicationId}/commits/last".replace("{applicationId}", application_id)
+            _APP_LAST_COMMIT_PATH % application_id
         )
         
         if not commit:
             return f"No commit found for application {application_id}."
         
-        result = f"Last commit for application {application_id}:\n\n"
-        result += f"Reference: {commit.get('reference')}\n"
-        result += f"Message: {commit.get('message')}\n"
-        result += f"Created: {commit.get('createdAt')}\n"
-        
-        author_name = commit.get('authorName')
-        if author_name:
-            result += f"Author: {author_name}"
-            
-            author_email = commit.get('authorEmail')
-            if author_email:
-                result += f" <{author_email}>"
-                
-            result += "\n"
-            
-        committer_name = commit.get('committerName')
-        if committer_name and committer_name != author_name:
-            result += f"Committer: {committer_name}\n"
-            
-        return result
+        return "".join(chain(
+            [f"Last commit for application {application_id}:\n\n"],
+            _render_commit_fragments(commit)
+        ))
     except QuixApiError as e:
         return f"Error retrieving last commit: {str(e)}"
 
@@ -643,39 +797,98 @@ async def get_application_tags(ctx: Context, application_id: str) -> str:
         tags = await make_quix_request(
             ctx, 
             "GET", 
-            "{workspaceId}/applications/{applicationId}/tags".replace("{applicationId}", application_id)
+            _APP_TAGS_PATH % application_id
         )
         
         if not tags:
             return f"No tags found for application {application_id}."
         
-        result = f"Tags for application {application_id}:\n\n"
-        for tag in tags:
-            result += f"Name: {tag.get('name')}\n"
-            result += f"Reference: {tag.get('reference')}\n"
-            result += f"Message: {tag.get('message')}\n"
-            result += f"Created: {tag.get('createdAt')}\n"
-            
-            author_name = tag.get('authorName')
-            if author_name:
-                result += f"Author: {author_name}"
-                
-                author_email = tag.get('authorEmail')
-                if author_email:
-                    result += f" <{author_email}>"
-                    
-                result += "\n"
-                
-            committer_name = tag.get('committerName')
-            if committer_name and committer_name != author_name:
-                result += f"Committer: {committer_name}\n"
-                
-            result += "-" * 40 + "\n"
-            
-        return result
+        return "".join(chain(
+            [f"Tags for application {application_id}:\n\n"],
+            chain.from_iterable(
+                chain((f"Name: {tag.get('name')}\n",), _render_commit_fragments(tag), (_APP_SEPARATOR,))
+                for tag in tags
+            )
+        ))
     except QuixApiError as e:
         return f"Error retrieving tags: {str(e)}"
 
+def _validate_variable(var: Dict[str, Any]) -> Optional[str]:
+    """Return an error message if var does not follow the ApplicationVariable schema."""
+    if "name" not in var:
+        return f"Error: Missing 'name' field in variable {var}"
+        
+    if "inputType" not in var:
+        return f"Error: Missing 'inputType' field in variable '{var.get('name')}'"
+        
+    if var.get("inputType") not in _VALID_INPUT_TYPES:
+        return f"Error: Invalid 'inputType' value '{var.get('inputType')}' for variable '{var.get('name')}'. Must be one of: {_VALID_INPUT_TYPES_STR}"
+        
+    if "required" not in var:
+        return f"Error: Missing 'required' field in variable '{var.get('name')}'"
+    
+    return None
+
+def _render_variable(parts: List[str], var: Dict[str, Any]) -> None:
+    """Append the description of a single variable to parts."""
+    get = var.get
+    parts.append(f"• {get('name')} ({get('inputType')})\n")
+    
+    if description := get('description'):
+        parts.append(f"  Description: {description}\n")
+        
+    if default_value := get('defaultValue'):
+        parts.append(f"  Default Value: {default_value}\n")
+        
+    parts.append(f"  Required: {get('required')}\n")
+    
+    if multiline := get('multiline'):
+        parts.append(f"  Multiline: {multiline}\n")
+
+async def _add_variables(
+    ctx: Context,
+    application_id: str,
+    new_variables: List[Dict[str, Any]],
+    overwrite_existing: bool = False
+) -> Optional[Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]], List[str]]]:
+    """Merge new_variables into the application's variables with a single PATCH.
+    
+    Returns None if the application does not exist, otherwise the PATCH response,
+    the final variables and the names of new variables skipped because they
+    already exist. Nothing is sent (and the response is None) when every new
+    variable was skipped.
+    """
+    existing_variables = await _get_app_variables(ctx, application_id)
+    
+    if existing_variables is None:
+        return None
+    
+    merged = {var.get('name'): var for var in existing_variables}
+    skipped = []
+    for var in new_variables:
+        name = var.get('name')
+        if name in merged and not overwrite_existing:
+            skipped.append(name)
+        else:
+            # Replaced variables keep their existing position
+            merged[name] = var
+    
+    if len(skipped) == len(new_variables):
+        return None, existing_variables, skipped
+    
+    final_variables = list(merged.values())
+    
+    application = await make_quix_request(
+        ctx, 
+        "PATCH", 
+        _APP_PATH % application_id,
+        json={"variables": final_variables}
+    )
+    
+    _remember_app_variables(application_id, application, final_variables)
+    
+    return application, final_variables, skipped
+
 @mcp.tool()
 async def add_application_variable(
     ctx: Context,
@@ -703,10 +916,8 @@ async def add_application_variable(
     """
     try:
         # Create the new variable
-        valid_input_types = ["Topic", "FreeText", "HiddenText", "InputTopic", "OutputTopic", "Secret"]
-        
-        if input_type not in valid_input_types:
-            return f"Error: Invalid input_type '{input_type}'. Must be one of: {', '.join(valid_input_types)}"
+        if input_type not in _VALID_INPUT_TYPES:
+            return f"Error: Invalid input_type '{input_type}'. Must be one of: {_VALID_INPUT_TYPES_STR}"
         
         new_variable = {
             "name": name,
@@ -723,63 +934,89 @@ async def add_application_variable(
         if default_value is not None:
             new_variable["defaultValue"] = default_value
         
-        # Get the current application details
-        current_app = await make_quix_request(
-            ctx, 
-            "GET", 
-            "{workspaceId}/applications/{applicationId}".replace("{applicationId}", application_id)
-        )
+        merged = await _add_variables(ctx, application_id, [new_variable])
         
-        if not current_app:
+        if merged is None:
             return f"No application found with ID {application_id}."
         
-        # Get existing variables
-        existing_variables = current_app.get('variables', [])
-        
-        # Check if a variable with this name already exists
-        for var in existing_variables:
-            if var.get('name') == name:
-                return f"Error: A variable with name '{name}' already exists in application {application_id}. Use update_application_variables to modify it."
+        application, final_variables, skipped = merged
         
-        # Create the final list of variables (existing + new)
-        final_variables = existing_variables + [new_variable]
-        
-        # Update the application
-        payload = {
-            "variables": final_variables
-        }
-        
-        application = await make_quix_request(
-            ctx, 
-            "PATCH", 
-            "{workspaceId}/applications/{applicationId}".replace("{applicationId}", application_id),
-            json=payload
-        )
+        # The variable already exists, so nothing was sent
+        if skipped:
+            return f"Error: A variable with name '{name}' already exists in application {application_id}. Use update_application_variables to modify it."
         
         if not application:
             return f"Failed to update variables for application {application_id}."
         
         # Format the response
-        result = f"Successfully added environment variable '{name}' to application '{application.get('name')}' (ID: {application_id}):\n\n"
+        parts = [f"Successfully added environment variable '{name}' to application '{application.get('name')}' (ID: {application_id}):\n\n"]
+        _render_variable(parts, new_variable)
+        parts.append(f"\nTotal environment variables: {len(final_variables)}")
         
-        result += f"• {name} ({input_type})\n"
+        return "".join(parts)
+    except QuixApiError as e:
+        return f"Error adding application variable: {str(e)}"
+
+@mcp.tool()
+async def add_application_variables(
+    ctx: Context,
+    application_id: str,
+    variables: List[Dict[str, Any]],
+    overwrite_existing: bool = False
+) -> str:
+    """Add several environment variables to an application with a single update.
+    
+    Args:
+        application_id: The ID of the application to update
+        variables: List of environment variables to add, following the ApplicationVariable schema
+            (see update_application_variables for the fields); each name may appear only once
+        overwrite_existing: Whether variables that already exist are replaced (True) or
+            left unchanged (False, default)
+    
+    Note: Existing variables that are not in the list are always preserved. Prefer this over
+    calling add_application_variable repeatedly, since it fetches and updates the application once.
+    """
+    try:
+        if not variables:
+            return "Error: No variables given. Pass at least one variable to add."
         
-        if description:
-            result += f"  Description: {description}\n"
-            
-        if default_value:
-            result += f"  Default Value: {default_value}\n"
-            
-        result += f"  Required: {required}\n"
+        names = set()
+        for var in variables:
+            error = _validate_variable(var)
+            if error:
+                return error
+            name = var['name']
+            if name in names:
+                return f"Error: Variable '{name}' is given more than once. Each variable may only be added once per call."
+            names.add(name)
+        
+        merged = await _add_variables(ctx, application_id, variables, overwrite_existing)
         
-        if multiline:
-            result += f"  Multiline: {multiline}\n"
+        if merged is None:
+            return f"No application found with ID {application_id}."
         
-        result += f"\nTotal environment variables: {len(final_variables)}"
+        application, final_variables, skipped = merged
         
-        return result
+        if len(skipped) == len(variables):
+            return f"No variables added to application {application_id}: all of them already exist ({', '.join(skipped)}). Set overwrite_existing to replace them."
+        
+        if not application:
+            return f"Failed to update variables for application {application_id}."
+        
+        parts = [f"Successfully added environment variables to application '{application.get('name')}' (ID: {application_id}):\n\n"]
+        for var in variables:
+            if var.get('name') not in skipped:
+                _render_variable(parts, var)
+                parts.append("\n")
+        
+        if skipped:
+            parts.append(f"Skipped existing variables: {', '.join(skipped)}\n\n")
+        
+        parts.append(f"Total environment variables: {len(final_variables)}")
+        
+        return "".join(parts)
     except QuixApiError as e:
-        return f"Error adding application variable: {str(e)}"
+        return f"Error adding application variables: {str(e)}"
 
 @mcp.tool()
 async def create_application_variable(
@@ -806,10 +1043,8 @@ async def create_application_variable(
     Returns:
         A properly formatted ApplicationVariable object
     """
-    valid_input_types = ["Topic", "FreeText", "HiddenText", "InputTopic", "OutputTopic", "Secret"]
-    
-    if input_type not in valid_input_types:
-        raise ValueError(f"Invalid input_type '{input_type}'. Must be one of: {', '.join(valid_input_types)}")
+    if input_type not in _VALID_INPUT_TYPES:
+        raise ValueError(f"Invalid input_type '{input_type}'. Must be one of: {_VALID_INPUT_TYPES_STR}")
     
     variable = {
         "name": name,
@@ -875,50 +1110,29 @@ async def update_application_variables(
     """
     try:
         # Validate the input variables
-        valid_input_types = ["Topic", "FreeText", "HiddenText", "InputTopic", "OutputTopic", "Secret"]
-        
         for var in variables:
-            # Check for required fields
-            if "name" not in var:
-                return f"Error: Missing 'name' field in variable {var}"
-                
-            if "inputType" not in var:
-                return f"Error: Missing 'inputType' field in variable '{var.get('name')}'"
-                
-            if var.get("inputType") not in valid_input_types:
-                return f"Error: Invalid 'inputType' value '{var.get('inputType')}' for variable '{var.get('name')}'. Must be one of: {', '.join(valid_input_types)}"
-                
-            if "required" not in var:
-                return f"Error: Missing 'required' field in variable '{var.get('name')}'"
+            error = _validate_variable(var)
+            if error:
+                return error
         
-        # Get the current application details
-        current_app = await make_quix_request(
-            ctx, 
-            "GET", 
-            "{workspaceId}/applications/{applicationId}".replace("{applicationId}", application_id)
-        )
+        # Get the existing variables
+        existing_variables = await _get_app_variables(ctx, application_id)
         
-        if not current_app:
+        if existing_variables is None:
             return f"No application found with ID {application_id}."
         
         # Determine the final set of variables to apply
         final_variables = []
         
+        # Names of the variables being modified/added, for quick checking
+        modified_names = {var.get('name') for var in variables}
+        
         if append:
-            # Get existing variables
-            existing_variables = current_app.get('variables', [])
-            
-            # Create a lookup of new variable names for quick checking
-            new_variable_names = {var.get('name'): var for var in variables}
-            
-            # Start with existing variables that aren't being updated
-            for var in existing_variables:
-                var_name = var.get('name')
-                if var_name not in new_variable_names:
-                    final_variables.append(var)
-                
-            # Add all new variables
-            final_variables.extend(variables)
+            # Updated variables keep their existing position; new ones go at the end
+            merged = {var.get('name'): var for var in existing_variables}
+            for var in variables:
+                merged[var.get('name')] = var
+            final_variables = list(merged.values())
             
             operation_description = "updated/added"
         else:
@@ -935,46 +1149,36 @@ async def update_application_variables(
         application = await make_quix_request(
             ctx, 
             "PATCH", 
-            "{workspaceId}/applications/{applicationId}".replace("{applicationId}", application_id),
+            _APP_PATH % application_id,
             json=payload
         )
         
+        _remember_app_variables(application_id, application, final_variables)
+        
         if not application:
             return f"Failed to update variables for application {application_id}."
         
         # Format the response with the updated variables
-        result = f"Successfully {operation_description} environment variables for application '{application.get('name')}' (ID: {application_id}):\n\n"
+        parts = [f"Successfully {operation_description} environment variables for application '{application.get('name')}' (ID: {application_id}):\n\n"]
         
         # First show the variables that were just modified/added
-        result += "Modified/Added Variables:\n"
+        parts.append("Modified/Added Variables:\n")
         for var in variables:
-            result += f"• {var.get('name')} ({var.get('inputType')})\n"
-            
-            if var.get('description'):
-                result += f"  Description: {var.get('description')}\n"
-                
-            if var.get('defaultValue'):
-                result += f"  Default Value: {var.get('defaultValue')}\n"
-                
-            result += f"  Required: {var.get('required')}\n"
-            
-            if var.get('multiline'):
-                result += f"  Multiline: {var.get('multiline')}\n"
-                
-            result += "\n"
+            _render_variable(parts, var)
+            parts.append("\n")
         
         # If there are other variables, list them too
-        other_vars = [var for var in final_variables if var.get('name') not in [v.get('name') for v in variables]]
+        other_vars = [var for var in final_variables if var.get('name') not in modified_names]
         if other_vars and append:
-            result += "Other Existing Variables:\n"
+            parts.append("Other Existing Variables:\n")
             for var in other_vars:
-                result += f"• {var.get('name')} ({var.get('inputType')})\n"
-            result += "\n"
+                parts.append(f"• {var.get('name')} ({var.get('inputType')})\n")
+            parts.append("\n")
         
         # Show total count
-        result += f"Total environment variables: {len(final_variables)}"
+        parts.append(f"Total environment variables: {len(final_variables)}")
         
-        return result
+        return "".join(parts)
     except QuixApiError as e:
         return f"Error updating application variables: {str(e)}"
 
@@ -1126,7 +1330,7 @@ async def get_deployments(ctx: Context, application_id: Optional[str] = None) ->
                     result += f"Network Service Name: {service_name}\n"
                     
                 ports = network.get('ports')
-                if ports and len(ports) > 0:
+                if ports:
                     result += "Port Mappings:\n"
                     for port in ports:
                         port_num = port.get('port')
@@ -1303,7 +1507,7 @@ async def get_deployment(ctx: Context, deployment_id: str) -> str:
                 result += f"Network Service Name: {service_name}\n"
                 
             ports = network.get('ports')
-            if ports and len(ports) > 0:
+            if ports:
                 result += "Port Mappings:\n"
                 for port in ports:
                     port_num = port.get('port')
@@ -1312,7 +1516,7 @@ async def get_deployment(ctx: Context, deployment_id: str) -> str:
                 
         # Add variables if present
         variables = deployment.get('variables')
-        if variables and len(variables) > 0:
+        if variables:
             result += "\nEnvironment Variables:\n"
             for var_name, var_info in variables.items():
                 result += f"• {var_name} ({var_info.get('inputType')})\n"
@@ -1411,18 +1615,18 @@ async def create_deployment(
     """
     try:
         # Validate input
-        if deployment_type not in [t.value for t in DeploymentType]:
-            return f"Error: Invalid deployment type. Must be one of: {', '.join([t.value for t in DeploymentType])}"
+        if deployment_type not in DeploymentType._value2member_map_:
+            return f"Error: Invalid deployment type. Must be one of: {', '.join(DeploymentType._value2member_map_)}"
             
-        if git_reference_type not in [t.value for t in DeploymentGitReferenceType]:
-            return f"Error: Invalid git reference type. Must be one of: {', '.join([t.value for t in DeploymentGitReferenceType])}"
+        if git_reference_type not in DeploymentGitReferenceType._value2member_map_:
+            return f"Error: Invalid git reference type. Must be one of: {', '.join(DeploymentGitReferenceType._value2member_map_)}"
             
         if public_access and not url_prefix:
             return "Error: url_prefix is required when public_access is True."
             
         # Build the request payload according to the DeploymentCreateRequestV2 schema
         payload = {
-            "workspaceId": os.environ.get("QUIX_WORKSPACE"),
+            "workspaceId": _api_settings()[1],
             "applicationId": application_id,
             "name": name,
             "replicas": replicas,
@@ -1540,11 +1744,11 @@ async def update_deployment(
     """
     try:
         # Validate input if provided
-        if deployment_type and deployment_type not in [t.value for t in DeploymentType]:
-            return f"Error: Invalid deployment type. Must be one of: {', '.join([t.value for t in DeploymentType])}"
+        if deployment_type and deployment_type not in DeploymentType._value2member_map_:
+            return f"Error: Invalid deployment type. Must be one of: {', '.join(DeploymentType._value2member_map_)}"
             
-        if git_reference_type and git_reference_type not in [t.value for t in DeploymentGitReferenceType]:
-            return f"Error: Invalid git reference type. Must be one of: {', '.join([t.value for t in DeploymentGitReferenceType])}"
+        if git_reference_type and git_reference_type not in DeploymentGitReferenceType._value2member_map_:
+            return f"Error: Invalid git reference type. Must be one of: {', '.join(DeploymentGitReferenceType._value2member_map_)}"
             
         # Build the request payload according to the DeploymentPatchRequestV2 schema
         payload = {}
@@ -1783,7 +1987,7 @@ async def get_deployment_secret_keys(ctx: Context) -> str:
     """Get deployment secrets keys in the workspace.
     """
     try:
-        workspace_id = os.environ.get("QUIX_WORKSPACE")
+        workspace_id = _api_settings()[1]
         if not workspace_id:
             return "Missing QUIX_WORKSPACE environment variable. Please set your Quix Workspace ID."
             
@@ -1815,7 +2019,7 @@ async def update_deployments(ctx: Context, deployment_ids: Optional[List[str]] =
         deployment_ids: Optional list of deployment IDs to update (if not specified, all deployments in the workspace will be updated)
     """
     try:
-        workspace_id = os.environ.get("QUIX_WORKSPACE")
+        workspace_id = _api_settings()[1]
         if not workspace_id:
             return "Missing QUIX_WORKSPACE environment variable. Please set your Quix Workspace ID."
             
@@ -1826,7 +2030,7 @@ async def update_deployments(ctx: Context, deployment_ids: Optional[List[str]] =
             json=deployment_ids if deployment_ids else []
         )
         
-        if deployment_ids and len(deployment_ids) > 0:
+        if deployment_ids:
             return f"Successfully initiated update for {len(deployment_ids)} deployment(s)."
         else:
             return "Successfully initiated update for all deployments in the workspace."
@@ -1939,8 +2143,8 @@ async def get_deployment_historical_logs(
     """
     try:
         # Validate input
-        if direction not in [d.value for d in LogDirection]:
-            return f"Error: Invalid direction. Must be one of: {', '.join([d.value for d in LogDirection])}"
+        if direction not in LogDirection._value2member_map_:
+            return f"Error: Invalid direction. Must be one of: {', '.join(LogDirection._value2member_map_)}"
             
         params = {
             "limit": limit,
@@ -1953,10 +2157,10 @@ async def get_deployment_historical_logs(
         if replica_id:
             params["replicaId"] = replica_id
             
-        if start:
+        if start is not None:
             params["start"] = start
             
-        if end:
+        if end is not None:
             params["end"] = end
             
         logs = await make_quix_request(
@@ -2025,10 +2229,10 @@ async def get_deployment_historical_log_stats(
         if replica_id:
             params["replicaId"] = replica_id
             
-        if start:
+        if start is not None:
             params["start"] = start
             
-        if end:
+        if end is not None:
             params["end"] = end
             
         stats = await make_quix_request(
@@ -2095,7 +2299,7 @@ async def download_deployment_logs(
     """
     try:
         params = {
-            "includeTimestamp": str(include_timestamp).lower()
+            "includeTimestamp": _BOOL_STR[include_timestamp]
         }
         
         if instance_id:
@@ -2293,7 +2497,7 @@ async def query_library(
                 
             # Add tags if present
             tags = item.get('tags')
-            if tags and len(tags) > 0:
+            if tags:
                 result += f"Tags: {', '.join(tags)}\n"
                 
             # Add description if present
@@ -2361,7 +2565,7 @@ async def get_library_item_details(ctx: Context, item_id: str) -> str:
             
         # Add tags if present
         tags = details.get('tags')
-        if tags and len(tags) > 0:
+        if tags:
             result += f"Tags: {', '.join(tags)}\n"
             
         # Add highlighted status if true
@@ -2430,14 +2634,14 @@ async def get_library_item_details(ctx: Context, item_id: str) -> str:
             
         # Add files if present
         files = details.get('files')
-        if files and len(files) > 0:
+        if files:
             result += "\nFiles:\n"
             for file in files:
                 result += f"- {file}\n"
                 
         # Add variables if present
         variables = details.get('variables')
-        if variables and len(variables) > 0:
+        if variables:
             result += "\nVariables:\n"
             for var in variables:
                 result += f"• {var.get('name')} ({var.get('inputType')})\n"
@@ -2478,8 +2682,9 @@ async def get_library_file_content(ctx: Context, item_id: str, file_path: str, p
             "filePath": file_path
         }
         
-        if os.environ.get("QUIX_WORKSPACE"):
-            payload["workspaceId"] = os.environ.get("QUIX_WORKSPACE")
+        workspace_id = _api_settings()[1]
+        if workspace_id:
+            payload["workspaceId"] = workspace_id
             
         if placeholder_replacements:
             payload["placeholderReplacements"] = placeholder_replacements
@@ -2527,6 +2732,11 @@ async def get_library_configuration(ctx: Context, source: Optional[str] = None)
         source: Optional source parameter
     """
     try:
+        cache_key = ("get_library_configuration", source)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+            
         params = {}
         if source:
             params["source"] = source
@@ -2551,6 +2761,7 @@ async def get_library_configuration(ctx: Context, source: Optional[str] = None)
         if branch:
             result += f"Branch: {branch}\n"
             
+        _response_cache.set(cache_key, result, LIBRARY_CACHE_TTL)
         return result
     except QuixApiError as e:
         return f"Error: {str(e)}"
@@ -2564,12 +2775,17 @@ async def get_library_languages(ctx: Context, connectors: Optional[bool] = None,
         auxiliary_services: Optional boolean to filter for auxiliary service items only (True) or exclude them (False)
     """
     try:
+        cache_key = ("get_library_languages", connectors, auxiliary_services)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+            
         params = {}
         if connectors is not None:
-            params["connectors"] = str(connectors).lower()
+            params["connectors"] = _BOOL_STR[connectors]
             
         if auxiliary_services is not None:
-            params["auxiliaryServices"] = str(auxiliary_services).lower()
+            params["auxiliaryServices"] = _BOOL_STR[auxiliary_services]
             
         languages = await make_quix_request(
             ctx,
@@ -2585,6 +2801,7 @@ async def get_library_languages(ctx: Context, connectors: Optional[bool] = None,
         for lang in languages:
             result += f"- {lang}\n"
         
+        _response_cache.set(cache_key, result, LIBRARY_CACHE_TTL)
         return result
     except QuixApiError as e:
         return f"Error: {str(e)}"
@@ -2598,12 +2815,17 @@ async def get_library_tags(ctx: Context, connectors: Optional[bool] = None, auxi
         auxiliary_services: Optional boolean to filter for auxiliary service items only (True) or exclude them (False)
     """
     try:
+        cache_key = ("get_library_tags", connectors, auxiliary_services)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+            
         params = {}
         if connectors is not None:
-            params["connectors"] = str(connectors).lower()
+            params["connectors"] = _BOOL_STR[connectors]
             
         if auxiliary_services is not None:
-            params["auxiliaryServices"] = str(auxiliary_services).lower()
+            params["auxiliaryServices"] = _BOOL_STR[auxiliary_services]
             
         tag_groups = await make_quix_request(
             ctx,
@@ -2623,12 +2845,13 @@ async def get_library_tags(ctx: Context, connectors: Optional[bool] = None, auxi
             if group_name:
                 result += f"Group: {group_name}\n"
                 
-            if tags and len(tags) > 0:
+            if tags:
                 for tag in tags:
                     result += f"- {tag}\n"
                 
             result += "\n"
         
+        _response_cache.set(cache_key, result, LIBRARY_CACHE_TTL)
         return result
     except QuixApiError as e:
         return f"Error: {str(e)}"
@@ -2653,7 +2876,7 @@ async def create_application_from_library(
     """
     try:
         # Ensure workspace ID is available
-        workspace_id = os.environ.get("QUIX_WORKSPACE")
+        workspace_id = _api_settings()[1]
         if not workspace_id:
             return "Missing QUIX_WORKSPACE environment variable. Please set your Quix Workspace ID."
             
@@ -2707,7 +2930,7 @@ async def create_deployment_from_library(
     """
     try:
         # Ensure workspace ID is available
-        workspace_id = os.environ.get("QUIX_WORKSPACE")
+        workspace_id = _api_settings()[1]
         if not workspace_id:
             return "Missing QUIX_WORKSPACE environment variable. Please set your Quix Workspace ID."
             
@@ -2753,8 +2976,9 @@ async def get_library_zip(
         # Build the request payload according to the LibraryZipContentRequest schema
         payload = {}
         
-        if os.environ.get("QUIX_WORKSPACE"):
-            payload["workspaceId"] = os.environ.get("QUIX_WORKSPACE")
+        workspace_id = _api_settings()[1]
+        if workspace_id:
+            payload["workspaceId"] = workspace_id
             
         if placeholder_replacements:
             payload["placeholderReplacements"] = placeholder_replacements
@@ -2778,158 +3002,303 @@ async def get_library_zip(
 # Topic Tools
 # =========================================
 
+# Field tables used to render topic responses. Each entry is
+# (response key, label, mode) where mode decides when the line is shown:
+# "always" prints unconditionally, "truthy" skips empty values and
+# "not_none" only skips missing values.
+_FIELD_MODES = {
+    "always": lambda value: True,
+    "truthy": bool,
+    "not_none": lambda value: value is not None,
+}
+
+_TOPIC_STATUS_FIELDS = (
+    ("status", "Status", "truthy"),
+)
+
+_TOPIC_ERROR_FIELDS = (
+    ("errorStatus", "Error Status", "always"),
+    ("lastError", "Last Error", "truthy"),
+)
+
+_TOPIC_STATE_FIELDS = (
+    ("createdAt", "Created At", "truthy"),
+    ("updatedAt", "Updated At", "truthy"),
+    ("persisted", "Persisted", "not_none"),
+    ("persistedStatus", "Persisted Status", "truthy"),
+    ("external", "External", "truthy"),
+    ("unmanaged", "Unmanaged", "truthy"),
+    ("sdkTopic", "SDK Topic", "truthy"),
+)
+
+_TOPIC_EXTERNAL_FIELDS = (
+    ("externalSourceName", "External Source", "truthy"),
+    ("externalDestinationName", "External Destination", "truthy"),
+)
+
+_TOPIC_SUMMARY_FIELDS = _TOPIC_STATE_FIELDS + _TOPIC_EXTERNAL_FIELDS
+
+_TOPIC_SEARCH_FIELDS = _TOPIC_STATUS_FIELDS + (("dataTier", "Data Tier", "truthy"),)
+
+_TOPIC_DETAIL_FIELDS = (
+    _TOPIC_STATE_FIELDS
+    + (("dataTier", "Data Tier", "truthy"),)
+    + _TOPIC_EXTERNAL_FIELDS
+)
+
+_TOPIC_CONFIG_FIELDS = (
+    ("partitions", "Partitions", "not_none"),
+    ("replicationFactor", "Replication Factor", "not_none"),
+    ("retentionInMinutes", "Retention (minutes)", "not_none"),
+    ("retentionInBytes", "Retention (bytes)", "not_none"),
+    ("cleanupPolicy", "Cleanup Policy", "truthy"),
+)
+
+_LINKED_TOPIC_FLAG_FIELDS = (
+    ("isLinked", "Is Linked", "truthy"),
+    ("isLocked", "Is Locked", "truthy"),
+    ("isScratchpad", "Is Scratchpad", "truthy"),
+)
+
+_LINKED_TOPIC_ACCESS_FIELDS = (
+    ("hasRepositoryAccess", "Has Repository Access", "not_none"),
+    ("hasWorkspaceAccess", "Has Workspace Access", "not_none"),
+)
+
+_LINKED_TOPIC_LOCATION_FIELDS = (
+    ("repositoryName", "Repository", "truthy"),
+    ("environmentName", "Environment", "truthy"),
+)
+
+_LINKED_TOPIC_SUMMARY_FIELDS = _LINKED_TOPIC_FLAG_FIELDS + _LINKED_TOPIC_LOCATION_FIELDS
+
+_LINKABLE_TOPIC_LINKED_FIELDS = (
+    ("isLinked", "Is Linked", "truthy"),
+    ("isLocked", "Is Locked", "truthy"),
+) + _LINKED_TOPIC_LOCATION_FIELDS
+
+_LINKED_TOPIC_DETAIL_FIELDS = (
+    _LINKED_TOPIC_FLAG_FIELDS
+    + _LINKED_TOPIC_ACCESS_FIELDS
+    + _LINKED_TOPIC_LOCATION_FIELDS
+)
+
+_TOPIC_METRIC_FIELDS = (
+    ("topicId", "Topic ID", "truthy"),
+    ("bytesInPerSecond", "Bytes In/sec", "not_none"),
+    ("bytesOutPerSecond", "Bytes Out/sec", "not_none"),
+    ("valuesPersistedPerSecond", "Values Persisted/sec", "not_none"),
+)
+
+_LINKED_DESTINATION_FIELDS = (
+    ("workspaceId", "Workspace ID", "truthy"),
+    ("topicName", "Topic Name", "truthy"),
+    ("repositoryName", "Repository", "truthy"),
+    ("environmentName", "Environment", "truthy"),
+)
+
+def _field_lines(data: Dict[str, Any], fields: tuple, indent: str = "") -> List[str]:
+    """Return an "indent + Label: value" line for each field that passes its mode."""
+    get = data.get
+    return [
+        f"{indent}{label}: {value}\n"
+        for key, label, mode in fields
+        if _FIELD_MODES[mode](value := get(key))
+    ]
+
+def _render(parts: List[str], data: Dict[str, Any], fields: tuple, indent: str = "") -> None:
+    """Append the field lines of data to parts."""
+    # A single extend with a sized list grows parts at most once per field table
+    parts.extend(_field_lines(data, fields, indent))
+
+def _render_config(parts: List[str], config: Dict[str, Any], indent: str = "  ") -> None:
+    """Append the lines of a topic configuration to parts."""
+    _render(parts, config, _TOPIC_CONFIG_FIELDS, indent)
+
+# Fixed headers and separators of the topic tool output
+_TOPICS_HEADER = "Topics:\n\n"
+_TOPIC_DETAILS_HEADER = "Topic Details:\n\n"
+_TOPIC_SEARCH_HEADER = "Topics found:\n\n"
+_LINKABLE_TOPICS_HEADER = "Linkable Topics:\n\n"
+_TOPIC_METRICS_HEADER = "Topic Metrics:\n\n"
+_REFRESH_CHECK_HEADER = "Potential changes from refreshing imported topics:\n\n"
+_REFRESH_HEADER = "Changes from refreshing imported topics:\n\n"
+_CONFIG_HEADER = "\nConfiguration:\n"
+_LINKED_INFO_HEADER = "\nLinked Topic Info:\n"
+_LINKED_DESTS_HEADER = "\nLinked Topic Destinations:\n"
+_DEST_SEPARATOR = "  ---\n"
+_TOPIC_SEPARATOR = "-" * 40 + "\n"
+
+def _render_config_diff(parts: List[str], current: Dict[str, Any], target: Dict[str, Any]) -> None:
+    """Append a "Label: current -> target" line to parts for each config field that differs."""
+    current_get = current.get
+    target_get = target.get
+    for key, label, _ in _TOPIC_CONFIG_FIELDS:
+        current_value = current_get(key)
+        target_value = target_get(key)
+        if current_value != target_value:
+            parts.append(f"    {label}: {current_value} -> {target_value}\n")
+
+def _render_topic_fragments(topic: Dict[str, Any], full_detail: bool = False):
+    """Yield the text fragments of one topic.
+    
+    full_detail adds the workspace ID, data tier and linked topic access
+    fields shown by get_topic but left out of the get_topics listing.
+    """
+    if full_detail:
+        yield f"Name: {topic.get('name')}\nID: {topic.get('id')}\nWorkspace ID: {topic.get('workspaceId')}\n"
+    else:
+        yield f"Name: {topic.get('name')}\nID: {topic.get('id')}\n"
+    yield from _field_lines(topic, _TOPIC_STATUS_FIELDS)
+    
+    # Include error information if present
+    if topic.get('errorStatus'):
+        yield from _field_lines(topic, _TOPIC_ERROR_FIELDS)
+        
+    yield from _field_lines(topic, _TOPIC_DETAIL_FIELDS if full_detail else _TOPIC_SUMMARY_FIELDS)
+        
+    # Add configuration if present
+    config = topic.get('configuration')
+    if config:
+        yield _CONFIG_HEADER
+        yield from _field_lines(config, _TOPIC_CONFIG_FIELDS, indent="  ")
+    
+    # Add linked topic info if present
+    linked_info = topic.get('linkedTopicInfo')
+    if linked_info:
+        yield _LINKED_INFO_HEADER
+        linked_fields = _LINKED_TOPIC_DETAIL_FIELDS if full_detail else _LINKED_TOPIC_SUMMARY_FIELDS
+        yield from _field_lines(linked_info, linked_fields, indent="  ")
+        
+    # Add linked topic destination info if present
+    linked_destinations = topic.get('linkedTopicDestinationInfo')
+    if linked_destinations:
+        yield _LINKED_DESTS_HEADER
+        
+        for dest in linked_destinations:
+            yield from _field_lines(dest, _LINKED_DESTINATION_FIELDS, indent="  ")
+            yield _DEST_SEPARATOR
+
+def _workspace_cache_key(*parts: Any) -> tuple:
+    """Build a response cache key scoped to the current workspace."""
+    return (_api_settings()[1],) + parts
+
+# Characters that would change the meaning of a topic name used as a URL path segment
+_UNSAFE_PATH_SEGMENT = re.compile(r"[/?#]")
+
+def _topic_path_parts(topic_name: str, *suffix: str) -> Tuple[str, ...]:
+    """Build the workspace-relative path_parts of a topic-scoped endpoint."""
+    if not topic_name or _UNSAFE_PATH_SEGMENT.search(topic_name):
+        raise QuixApiError(f"Invalid topic name '{topic_name}'.")
+    return ("topics", topic_name, *suffix)
+
+def _invalidate_topic_cache(topic_name: Optional[str] = None) -> None:
+    """Drop cached topic listings, and the cached details of topic_name if given."""
+    _response_cache.invalidate_prefix(_workspace_cache_key("get_topics"))
+    if topic_name:
+        _response_cache.invalidate_prefix(_workspace_cache_key("get_topic", topic_name))
+
+async def _conditional_get(
+    ctx: Context,
+    cache_key: tuple,
+    render: Callable[[Any], str],
+    path: Optional[str] = None,
+    path_parts: Optional[Tuple[str, ...]] = None,
+    params: Optional[Dict[str, Any]] = None
+) -> str:
+    """GET path or path_parts and return render(body), reusing the last rendering on 304 Not Modified."""
+    previous = _etag_responses.get(cache_key)
+    response = await make_quix_request(
+        ctx,
+        "GET",
+        path,
+        params=params,
+        headers={"If-None-Match": previous[0]} if previous else None,
+        path_parts=path_parts,
+        return_response=True
+    )
+    
+    if response.status_code == 304 and previous:
+        return previous[1]
+    
+    content = response.content
+    try:
+        body = orjson.loads(content) if content else None
+    except orjson.JSONDecodeError as e:
+        logger.error("Invalid JSON in API response: %s", e)
+        raise QuixApiError(f"Invalid JSON in API response: {str(e)}") from e
+    text = render(body)
+    etag = response.headers.get("ETag")
+    _etag_responses.pop(cache_key, None)
+    if etag:
+        # Evict the oldest entry once full; dicts keep insertion order
+        if len(_etag_responses) >= ETAG_CACHE_SIZE:
+            del _etag_responses[next(iter(_etag_responses))]
+        _etag_responses[cache_key] = (etag, text)
+    return text
+
+def _format_topics(topics: Optional[List[Dict[str, Any]]], verbose: bool) -> str:
+    """Format the workspace topic list, one line per topic unless verbose."""
+    if not topics:
+        return "No topics found in this workspace."
+    
+    if not verbose:
+        return "".join(chain(
+            [_TOPICS_HEADER, "Name\tID\tStatus\tPartitions\n"],
+            (
+                f"{topic.get('name')}\t{topic.get('id')}\t{topic.get('status') or ''}\t"
+                f"{(topic.get('configuration') or {}).get('partitions', '')}\n"
+                for topic in topics
+            )
+        ))
+    
+    return "".join(chain(
+        [_TOPICS_HEADER],
+        chain.from_iterable(chain(_render_topic_fragments(t), (_TOPIC_SEPARATOR,)) for t in topics)
+    ))
+
+@async_cached(_response_cache, ttl=TOPICS_CACHE_TTL, key=lambda ctx, verbose: _workspace_cache_key("get_topics", verbose))
+async def _get_topics_text(ctx: Context, verbose: bool) -> str:
+    """Fetch and format the workspace topic list. Raises QuixApiError."""
+    return await _conditional_get(
+        ctx,
+        _workspace_cache_key("get_topics", verbose),
+        lambda topics: _format_topics(topics, verbose),
+        path_parts=("topics",)
+    )
+
 @mcp.tool()
-async def get_topics(ctx: Context) -> str:
+async def get_topics(ctx: Context, verbose: bool = False) -> str:
     """List all topics in your workspace.
+    
+    By default each topic is listed on one line with its name, ID, status
+    and partition count. Use get_topic for the full details of a topic.
+    
+    Args:
+        verbose: Whether to include the full details of every topic (default: False)
     """
     try:
-        topics = await make_quix_request(
-            ctx, 
-            "GET", 
-            "{workspaceId}/topics"
-        )
-        
-        if not topics:
-            return "No topics found in this workspace."
-        
-        result = "Topics:\n\n"
-        for topic in topics:
-            result += f"Name: {topic.get('name')}\n"
-            result += f"ID: {topic.get('id')}\n"
-            
-            # Add status information
-            status = topic.get('status')
-            if status:
-                result += f"Status: {status}\n"
-                
-            # Include error information if present
-            error_status = topic.get('errorStatus')
-            if error_status:
-                result += f"Error Status: {error_status}\n"
-                last_error = topic.get('lastError')
-                if last_error:
-                    result += f"Last Error: {last_error}\n"
-                    
-            # Add timestamps
-            created_at = topic.get('createdAt')
-            if created_at:
-                result += f"Created At: {created_at}\n"
-                
-            updated_at = topic.get('updatedAt')
-            if updated_at:
-                result += f"Updated At: {updated_at}\n"
-                
-            # Add persistence info if present
-            persisted = topic.get('persisted')
-            if persisted is not None:
-                result += f"Persisted: {persisted}\n"
-                
-            persisted_status = topic.get('persistedStatus')
-            if persisted_status:
-                result += f"Persisted Status: {persisted_status}\n"
-                
-            # Add other flags
-            external = topic.get('external')
-            if external:
-                result += f"External: {external}\n"
-                
-            unmanaged = topic.get('unmanaged')
-            if unmanaged:
-                result += f"Unmanaged: {unmanaged}\n"
-                
-            sdk_topic = topic.get('sdkTopic')
-            if sdk_topic:
-                result += f"SDK Topic: {sdk_topic}\n"
-                
-            # Add external sources/destinations if present
-            external_source = topic.get('externalSourceName')
-            if external_source:
-                result += f"External Source: {external_source}\n"
-                
-            external_destination = topic.get('externalDestinationName')
-            if external_destination:
-                result += f"External Destination: {external_destination}\n"
-                
-            # Add configuration if present
-            config = topic.get('configuration')
-            if config:
-                result += "\nConfiguration:\n"
-                
-                partitions = config.get('partitions')
-                if partitions is not None:
-                    result += f"  Partitions: {partitions}\n"
-                    
-                replication = config.get('replicationFactor')
-                if replication is not None:
-                    result += f"  Replication Factor: {replication}\n"
-                    
-                retention_mins = config.get('retentionInMinutes')
-                if retention_mins is not None:
-                    result += f"  Retention (minutes): {retention_mins}\n"
-                    
-                retention_bytes = config.get('retentionInBytes')
-                if retention_bytes is not None:
-                    result += f"  Retention (bytes): {retention_bytes}\n"
-                    
-                cleanup_policy = config.get('cleanupPolicy')
-                if cleanup_policy:
-                    result += f"  Cleanup Policy: {cleanup_policy}\n"
-            
-            # Add linked topic info if present
-            linked_info = topic.get('linkedTopicInfo')
-            if linked_info:
-                result += "\nLinked Topic Info:\n"
-                
-                is_linked = linked_info.get('isLinked')
-                if is_linked:
-                    result += f"  Is Linked: {is_linked}\n"
-                    
-                is_locked = linked_info.get('isLocked')
-                if is_locked:
-                    result += f"  Is Locked: {is_locked}\n"
-                    
-                is_scratchpad = linked_info.get('isScratchpad')
-                if is_scratchpad:
-                    result += f"  Is Scratchpad: {is_scratchpad}\n"
-                    
-                repository_name = linked_info.get('repositoryName')
-                if repository_name:
-                    result += f"  Repository: {repository_name}\n"
-                    
-                environment_name = linked_info.get('environmentName')
-                if environment_name:
-                    result += f"  Environment: {environment_name}\n"
-                
-            # Add linked topic destination info if present
-            linked_destinations = topic.get('linkedTopicDestinationInfo')
-            if linked_destinations and len(linked_destinations) > 0:
-                result += "\nLinked Topic Destinations:\n"
-                
-                for dest in linked_destinations:
-                    dest_workspace = dest.get('workspaceId')
-                    if dest_workspace:
-                        result += f"  Workspace ID: {dest_workspace}\n"
-                        
-                    dest_topic = dest.get('topicName')
-                    if dest_topic:
-                        result += f"  Topic Name: {dest_topic}\n"
-                        
-                    dest_repo = dest.get('repositoryName')
-                    if dest_repo:
-                        result += f"  Repository: {dest_repo}\n"
-                        
-                    dest_env = dest.get('environmentName')
-                    if dest_env:
-                        result += f"  Environment: {dest_env}\n"
-                        
-                    result += "  ---\n"
-            
-            result += "-" * 40 + "\n"
-        
-        return result
+        return await _get_topics_text(ctx, verbose)
     except QuixApiError as e:
         return f"Error: {str(e)}"
 
+@async_cached(_response_cache, ttl=TOPICS_CACHE_TTL, key=lambda ctx, topic_name: _workspace_cache_key("get_topic", topic_name))
+async def _get_topic_text(ctx: Context, topic_name: str) -> str:
+    """Fetch and format a single topic. Raises QuixApiError."""
+    def render(topic: Optional[Dict[str, Any]]) -> str:
+        if not topic:
+            return f"No topic found with name {topic_name}."
+        
+        # Format the topic details
+        return "".join(chain([_TOPIC_DETAILS_HEADER], _render_topic_fragments(topic, full_detail=True)))
+    
+    return await _conditional_get(
+        ctx,
+        _workspace_cache_key("get_topic", topic_name),
+        render,
+        path_parts=_topic_path_parts(topic_name)
+    )
+
 @mcp.tool()
 async def get_topic(ctx: Context, topic_name: str) -> str:
     """Get details of a specific topic.
@@ -2938,165 +3307,37 @@ async def get_topic(ctx: Context, topic_name: str) -> str:
         topic_name: The name of the topic to retrieve
     """
     try:
-        topic = await make_quix_request(
-            ctx, 
-            "GET", 
-            "{workspaceId}/topics/{topicName}".replace("{topicName}", topic_name)
-        )
-        
-        if not topic:
-            return f"No topic found with name {topic_name}."
-        
-        # Format the topic details
-        result = "Topic Details:\n\n"
-        result += f"Name: {topic.get('name')}\n"
-        result += f"ID: {topic.get('id')}\n"
-        result += f"Workspace ID: {topic.get('workspaceId')}\n"
-        
-        # Add status information
-        status = topic.get('status')
-        if status:
-            result += f"Status: {status}\n"
-            
-        # Include error information if present
-        error_status = topic.get('errorStatus')
-        if error_status:
-            result += f"Error Status: {error_status}\n"
-            last_error = topic.get('lastError')
-            if last_error:
-                result += f"Last Error: {last_error}\n"
-                
-        # Add timestamps
-        created_at = topic.get('createdAt')
-        if created_at:
-            result += f"Created At: {created_at}\n"
-            
-        updated_at = topic.get('updatedAt')
-        if updated_at:
-            result += f"Updated At: {updated_at}\n"
-            
-        # Add persistence info if present
-        persisted = topic.get('persisted')
-        if persisted is not None:
-            result += f"Persisted: {persisted}\n"
-            
-        persisted_status = topic.get('persistedStatus')
-        if persisted_status:
-            result += f"Persisted Status: {persisted_status}\n"
-            
-        # Add other flags
-        external = topic.get('external')
-        if external:
-            result += f"External: {external}\n"
-            
-        unmanaged = topic.get('unmanaged')
-        if unmanaged:
-            result += f"Unmanaged: {unmanaged}\n"
-            
-        sdk_topic = topic.get('sdkTopic')
-        if sdk_topic:
-            result += f"SDK Topic: {sdk_topic}\n"
-            
-        # Add data tier info if present
-        data_tier = topic.get('dataTier')
-        if data_tier:
-            result += f"Data Tier: {data_tier}\n"
-            
-        # Add external sources/destinations if present
-        external_source = topic.get('externalSourceName')
-        if external_source:
-            result += f"External Source: {external_source}\n"
-            
-        external_destination = topic.get('externalDestinationName')
-        if external_destination:
-            result += f"External Destination: {external_destination}\n"
-            
-        # Add configuration if present
-        config = topic.get('configuration')
-        if config:
-            result += "\nConfiguration:\n"
-            
-            partitions = config.get('partitions')
-            if partitions is not None:
-                result += f"  Partitions: {partitions}\n"
-                
-            replication = config.get('replicationFactor')
-            if replication is not None:
-                result += f"  Replication Factor: {replication}\n"
-                
-            retention_mins = config.get('retentionInMinutes')
-            if retention_mins is not None:
-                result += f"  Retention (minutes): {retention_mins}\n"
-                
-            retention_bytes = config.get('retentionInBytes')
-            if retention_bytes is not None:
-                result += f"  Retention (bytes): {retention_bytes}\n"
-                
-            cleanup_policy = config.get('cleanupPolicy')
-            if cleanup_policy:
-                result += f"  Cleanup Policy: {cleanup_policy}\n"
-        
-        # Add linked topic info if present
-        linked_info = topic.get('linkedTopicInfo')
-        if linked_info:
-            result += "\nLinked Topic Info:\n"
-            
-            is_linked = linked_info.get('isLinked')
-            if is_linked:
-                result += f"  Is Linked: {is_linked}\n"
-                
-            is_locked = linked_info.get('isLocked')
-            if is_locked:
-                result += f"  Is Locked: {is_locked}\n"
-                
-            is_scratchpad = linked_info.get('isScratchpad')
-            if is_scratchpad:
-                result += f"  Is Scratchpad: {is_scratchpad}\n"
-                
-            has_repo_access = linked_info.get('hasRepositoryAccess')
-            if has_repo_access is not None:
-                result += f"  Has Repository Access: {has_repo_access}\n"
-                
-            has_workspace_access = linked_info.get('hasWorkspaceAccess')
-            if has_workspace_access is not None:
-                result += f"  Has Workspace Access: {has_workspace_access}\n"
-                
-            repository_name = linked_info.get('repositoryName')
-            if repository_name:
-                result += f"  Repository: {repository_name}\n"
-                
-            environment_name = linked_info.get('environmentName')
-            if environment_name:
-                result += f"  Environment: {environment_name}\n"
-            
-        # Add linked topic destination info if present
-        linked_destinations = topic.get('linkedTopicDestinationInfo')
-        if linked_destinations and len(linked_destinations) > 0:
-            result += "\nLinked Topic Destinations:\n"
-            
-            for dest in linked_destinations:
-                dest_workspace = dest.get('workspaceId')
-                if dest_workspace:
-                    result += f"  Workspace ID: {dest_workspace}\n"
-                    
-                dest_topic = dest.get('topicName')
-                if dest_topic:
-                    result += f"  Topic Name: {dest_topic}\n"
-                    
-                dest_repo = dest.get('repositoryName')
-                if dest_repo:
-                    result += f"  Repository: {dest_repo}\n"
-                    
-                dest_env = dest.get('environmentName')
-                if dest_env:
-                    result += f"  Environment: {dest_env}\n"
-                    
-                result += "  ---\n"
-                
-        return result
+        return await _get_topic_text(ctx, topic_name)
     except QuixApiError as e:
         return f"Error: {str(e)}"
 
+@mcp.tool()
+async def get_topics_details(ctx: Context, topic_names: List[str]) -> str:
+    """Get details of several topics at once.
+    
+    Args:
+        topic_names: The names of the topics to retrieve
+    """
+    if not topic_names:
+        return "No topic names provided."
+        
+    # Fetch all topics concurrently; a failure for one name doesn't abort the others
+    results = await asyncio.gather(
+        *(_get_topic_text(ctx, name) for name in topic_names),
+        return_exceptions=True
+    )
+    
+    parts = []
+    for name, result in zip(topic_names, results):
+        if isinstance(result, QuixApiError):
+            parts.append(f"Error retrieving topic '{name}': {str(result)}\n")
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            parts.append(result)
+            
+    return ("\n" + _TOPIC_SEPARATOR).join(parts)
+
 @mcp.tool()
 async def create_topic(
     ctx: Context,
@@ -3130,46 +3371,30 @@ async def create_topic(
         linked_topic_name: Optional topic name for a linked topic
     """
     try:
-        # Build the topic create request according to the TopicCreateRequest schema
-        payload = {
-            "name": name,
-            "unmanaged": unmanaged
-        }
-        
-        # Add configuration if any related parameters are provided
-        if any([partitions, replication_factor, retention_in_minutes, retention_in_bytes, cleanup_policy]):
-            config = {}
+        # Validate cleanup policy
+        if cleanup_policy and cleanup_policy not in _VALID_CLEANUP_POLICIES:
+            return f"Error: Invalid cleanup policy. Must be one of: {_VALID_CLEANUP_POLICIES_STR}"
             
-            if partitions is not None:
-                config["partitions"] = partitions
-                
-            if replication_factor is not None:
-                config["replicationFactor"] = replication_factor
-                
-            if retention_in_minutes is not None:
-                config["retentionInMinutes"] = retention_in_minutes
-                
-            if retention_in_bytes is not None:
-                config["retentionInBytes"] = retention_in_bytes
-                
-            if cleanup_policy:
-                # Validate cleanup policy
-                valid_policies = [p.value for p in TopicCleanupPolicy]
-                if cleanup_policy not in valid_policies:
-                    return f"Error: Invalid cleanup policy. Must be one of: {', '.join(valid_policies)}"
-                config["cleanupPolicy"] = cleanup_policy
-                
-            payload["configuration"] = config
+        # Add configuration if any related parameters are provided
+        config_items = (
+            ("partitions", partitions),
+            ("replicationFactor", replication_factor),
+            ("retentionInMinutes", retention_in_minutes),
+            ("retentionInBytes", retention_in_bytes),
+            ("cleanupPolicy", cleanup_policy or None),
+        )
+        config = {k: v for k, v in config_items if v is not None}
         
-        # Add optional parameters if provided
-        if data_tier_name:
-            payload["dataTierName"] = data_tier_name
-            
-        if external_source_name:
-            payload["externalSourceName"] = external_source_name
-            
-        if external_destination_name:
-            payload["externalDestinationName"] = external_destination_name
+        # Build the topic create request according to the TopicCreateRequest schema
+        payload_items = (
+            ("name", name),
+            ("unmanaged", unmanaged),
+            ("configuration", config or None),
+            ("dataTierName", data_tier_name or None),
+            ("externalSourceName", external_source_name or None),
+            ("externalDestinationName", external_destination_name or None),
+        )
+        payload = {k: v for k, v in payload_items if v is not None}
             
         # Add linked topic info if both required parameters are provided
         if linked_topic_workspace_id and linked_topic_name:
@@ -3184,57 +3409,33 @@ async def create_topic(
         topic = await make_quix_request(
             ctx,
             "POST",
-            "{workspaceId}/topics",
+            path_parts=("topics",),
             json=payload
         )
+        _invalidate_topic_cache(name)
         
         if not topic:
             return f"Failed to create topic '{name}'."
             
-        result = f"Successfully created topic '{name}'.\n\n"
-        result += f"Topic ID: {topic.get('id')}\n"
-        result += f"Status: {topic.get('status')}\n"
+        parts = [
+            f"Successfully created topic '{name}'.\n\n"
+            f"Topic ID: {topic.get('id')}\n"
+            f"Status: {topic.get('status')}\n"
+        ]
         
         # Show configuration if present
         config = topic.get('configuration')
         if config:
-            result += "\nConfiguration:\n"
-            
-            partitions = config.get('partitions')
-            if partitions is not None:
-                result += f"  Partitions: {partitions}\n"
-                
-            replication = config.get('replicationFactor')
-            if replication is not None:
-                result += f"  Replication Factor: {replication}\n"
-                
-            retention_mins = config.get('retentionInMinutes')
-            if retention_mins is not None:
-                result += f"  Retention (minutes): {retention_mins}\n"
-                
-            retention_bytes = config.get('retentionInBytes')
-            if retention_bytes is not None:
-                result += f"  Retention (bytes): {retention_bytes}\n"
-                
-            cleanup_policy = config.get('cleanupPolicy')
-            if cleanup_policy:
-                result += f"  Cleanup Policy: {cleanup_policy}\n"
+            parts.append(_CONFIG_HEADER)
+            _render_config(parts, config)
                 
         # Show linking info if present
         linked_info = topic.get('linkedTopicInfo')
         if linked_info and linked_info.get('isLinked'):
-            result += "\nLinked Topic Info:\n"
-            result += f"  Is Linked: {linked_info.get('isLinked')}\n"
-            
-            repository_name = linked_info.get('repositoryName')
-            if repository_name:
-                result += f"  Repository: {repository_name}\n"
+            parts.append(f"\nLinked Topic Info:\n  Is Linked: {linked_info.get('isLinked')}\n")
+            _render(parts, linked_info, _LINKED_TOPIC_LOCATION_FIELDS, indent="  ")
                 
-            environment_name = linked_info.get('environmentName')
-            if environment_name:
-                result += f"  Environment: {environment_name}\n"
-                
-        return result
+        return "".join(parts)
     except QuixApiError as e:
         return f"Error creating topic: {str(e)}"
 
@@ -3271,45 +3472,23 @@ async def update_topic(
         linked_topic_name: Optional topic name for a linked topic
     """
     try:
-        # Build the topic patch request according to the TopicPatchRequest schema
-        payload = {}
-        
-        # Add partitions if provided
-        if partitions is not None:
-            payload["partitions"] = partitions
-            
-        # Add retention values if provided
-        if retention_in_minutes is not None:
-            payload["retentionInMinutes"] = retention_in_minutes
-            
-        if retention_in_bytes is not None:
-            payload["retentionInBytes"] = retention_in_bytes
-            
-        # Add cleanup policy if provided
-        if cleanup_policy:
-            # Validate cleanup policy
-            valid_policies = [p.value for p in TopicCleanupPolicy]
-            if cleanup_policy not in valid_policies:
-                return f"Error: Invalid cleanup policy. Must be one of: {', '.join(valid_policies)}"
-            payload["cleanupPolicy"] = cleanup_policy
-            
-        # Add data tier info if provided
-        if data_tier_name:
-            payload["dataTierName"] = data_tier_name
-            
-        if unset_data_tier:
-            payload["unsetDataTier"] = True
-            
-        # Add external source/destination if provided
-        if external_source_name:
-            payload["externalSourceName"] = external_source_name
+        # Validate cleanup policy
+        if cleanup_policy and cleanup_policy not in _VALID_CLEANUP_POLICIES:
+            return f"Error: Invalid cleanup policy. Must be one of: {_VALID_CLEANUP_POLICIES_STR}"
             
-        if external_destination_name:
-            payload["externalDestinationName"] = external_destination_name
-            
-        # Add unlinking if requested
-        if unlink_topic:
-            payload["unlinkTopic"] = True
+        # Build the topic patch request according to the TopicPatchRequest schema
+        payload_items = (
+            ("partitions", partitions),
+            ("retentionInMinutes", retention_in_minutes),
+            ("retentionInBytes", retention_in_bytes),
+            ("cleanupPolicy", cleanup_policy or None),
+            ("dataTierName", data_tier_name or None),
+            ("unsetDataTier", True if unset_data_tier else None),
+            ("externalSourceName", external_source_name or None),
+            ("externalDestinationName", external_destination_name or None),
+            ("unlinkTopic", True if unlink_topic else None),
+        )
+        payload = {k: v for k, v in payload_items if v is not None}
             
         # Add linked topic info if both required parameters are provided
         if linked_topic_workspace_id and linked_topic_name:
@@ -3324,72 +3503,44 @@ async def update_topic(
         topic = await make_quix_request(
             ctx,
             "PATCH",
-            "{workspaceId}/topics/{topicName}".replace("{topicName}", topic_name),
+            path_parts=_topic_path_parts(topic_name),
             json=payload
         )
+        _invalidate_topic_cache(topic_name)
         
         if not topic:
             return f"Failed to update topic '{topic_name}'."
             
-        result = f"Successfully updated topic '{topic_name}'.\n\n"
-        result += f"Topic ID: {topic.get('id')}\n"
-        result += f"Status: {topic.get('status')}\n"
+        parts = [
+            f"Successfully updated topic '{topic_name}'.\n\n"
+            f"Topic ID: {topic.get('id')}\n"
+            f"Status: {topic.get('status')}\n"
+        ]
         
         # Show updated configuration
         config = topic.get('configuration')
         if config:
-            result += "\nUpdated Configuration:\n"
-            
-            config_partitions = config.get('partitions')
-            if config_partitions is not None:
-                result += f"  Partitions: {config_partitions}\n"
-                
-            replication = config.get('replicationFactor')
-            if replication is not None:
-                result += f"  Replication Factor: {replication}\n"
-                
-            retention_mins = config.get('retentionInMinutes')
-            if retention_mins is not None:
-                result += f"  Retention (minutes): {retention_mins}\n"
-                
-            retention_bytes = config.get('retentionInBytes')
-            if retention_bytes is not None:
-                result += f"  Retention (bytes): {retention_bytes}\n"
-                
-            config_cleanup_policy = config.get('cleanupPolicy')
-            if config_cleanup_policy:
-                result += f"  Cleanup Policy: {config_cleanup_policy}\n"
+            parts.append("\nUpdated Configuration:\n")
+            _render_config(parts, config)
                 
         # Show data tier if present
         data_tier = topic.get('dataTier')
         if data_tier:
-            result += f"\nData Tier: {data_tier}\n"
+            parts.append(f"\nData Tier: {data_tier}\n")
             
         # Show external info if present
-        external_source = topic.get('externalSourceName')
-        if external_source:
-            result += f"External Source: {external_source}\n"
-            
-        external_destination = topic.get('externalDestinationName')
-        if external_destination:
-            result += f"External Destination: {external_destination}\n"
+        _render(parts, topic, _TOPIC_EXTERNAL_FIELDS)
             
         # Show linking info if present
         linked_info = topic.get('linkedTopicInfo')
         if linked_info:
             is_linked = linked_info.get('isLinked')
-            result += f"\nIs Linked: {is_linked}\n"
+            parts.append(f"\nIs Linked: {is_linked}\n")
             
             if is_linked:
-                repository_name = linked_info.get('repositoryName')
-                if repository_name:
-                    result += f"Repository: {repository_name}\n"
-                    
-                environment_name = linked_info.get('environmentName')
-                if environment_name:
-                    result += f"Environment: {environment_name}\n"
+                _render(parts, linked_info, _LINKED_TOPIC_LOCATION_FIELDS)
                 
-        return result
+        return "".join(parts)
     except QuixApiError as e:
         return f"Error updating topic: {str(e)}"
 
@@ -3404,8 +3555,9 @@ async def delete_topic(ctx: Context, topic_name: str) -> str:
         result = await make_quix_request(
             ctx,
             "DELETE",
-            "{workspaceId}/topics/{topicName}".replace("{topicName}", topic_name)
+            path_parts=_topic_path_parts(topic_name)
         )
+        _invalidate_topic_cache(topic_name)
         
         return f"Successfully deleted topic '{topic_name}'."
     except QuixApiError as e:
@@ -3422,8 +3574,9 @@ async def clean_topic(ctx: Context, topic_name: str) -> str:
         result = await make_quix_request(
             ctx,
             "POST",
-            "{workspaceId}/topics/{topicName}/clean".replace("{topicName}", topic_name)
+            path_parts=_topic_path_parts(topic_name, "clean")
         )
+        _invalidate_topic_cache(topic_name)
         
         return f"Successfully cleaned topic '{topic_name}'."
     except QuixApiError as e:
@@ -3440,52 +3593,65 @@ async def clear_topic_error(ctx: Context, topic_name: str) -> str:
         result = await make_quix_request(
             ctx,
             "POST",
-            "{workspaceId}/topics/{topicName}/clear-error".replace("{topicName}", topic_name)
+            path_parts=_topic_path_parts(topic_name, "clear-error")
         )
+        _invalidate_topic_cache(topic_name)
         
         return f"Successfully cleared error state for topic '{topic_name}'."
     except QuixApiError as e:
         return f"Error clearing topic error: {str(e)}"
 
+def _format_default_topic_config(config: Optional[Dict[str, Any]]) -> str:
+    """Format the default topic configuration."""
+    if not config:
+        return "No default topic configuration found."
+        
+    parts = ["Default Topic Configuration:\n\n"]
+    _render_config(parts, config, indent="")
+    return "".join(parts)
+
+@async_cached(_response_cache, ttl=DEFAULT_TOPIC_CONFIG_CACHE_TTL, key=lambda ctx: _workspace_cache_key("get_default_topic_config"))
+async def _get_default_topic_config_text(ctx: Context) -> str:
+    """Fetch and format the default topic configuration. Raises QuixApiError."""
+    return await _conditional_get(
+        ctx,
+        _workspace_cache_key("get_default_topic_config"),
+        _format_default_topic_config,
+        path_parts=("topics", "config", "default")
+    )
+
 @mcp.tool()
 async def get_default_topic_config(ctx: Context) -> str:
     """Get the default topic configuration for your workspace.
     """
     try:
-        config = await make_quix_request(
-            ctx,
-            "GET",
-            "{workspaceId}/topics/config/default"
+        return await _get_default_topic_config_text(ctx)
+    except QuixApiError as e:
+        return f"Error retrieving default topic configuration: {str(e)}"
+
+def _format_topic_search(topics: Optional[List[Dict[str, Any]]]) -> str:
+    """Format the topics returned by a topic search."""
+    if not topics:
+        return "No topics found matching the search criteria."
+        
+    parts = [_TOPIC_SEARCH_HEADER]
+    for topic in topics:
+        get = topic.get
+        parts.append(
+            f"Name: {get('name')}\n"
+            f"ID: {get('id')}\n"
+            f"Workspace ID: {get('workspaceId')}\n"
         )
-        
-        if not config:
-            return "No default topic configuration found."
+        _render(parts, topic, _TOPIC_SEARCH_FIELDS)
             
-        result = "Default Topic Configuration:\n\n"
+        # Add linked topic info if present
+        linked_info = get('linkedTopicInfo')
+        if linked_info:
+            _render(parts, linked_info, _LINKED_TOPIC_SUMMARY_FIELDS)
+                
+        parts.append(_TOPIC_SEPARATOR)
         
-        partitions = config.get('partitions')
-        if partitions is not None:
-            result += f"Partitions: {partitions}\n"
-            
-        replication = config.get('replicationFactor')
-        if replication is not None:
-            result += f"Replication Factor: {replication}\n"
-            
-        retention_mins = config.get('retentionInMinutes')
-        if retention_mins is not None:
-            result += f"Retention (minutes): {retention_mins}\n"
-            
-        retention_bytes = config.get('retentionInBytes')
-        if retention_bytes is not None:
-            result += f"Retention (bytes): {retention_bytes}\n"
-            
-        cleanup_policy = config.get('cleanupPolicy')
-        if cleanup_policy:
-            result += f"Cleanup Policy: {cleanup_policy}\n"
-            
-        return result
-    except QuixApiError as e:
-        return f"Error retrieving default topic configuration: {str(e)}"
+    return "".join(parts)
 
 @mcp.tool()
 async def search_topics(
@@ -3514,138 +3680,67 @@ async def search_topics(
         page_size: Optional page size for pagination
     """
     try:
-        params = {}
-        
-        # Add filters if provided
-        if data_tier:
-            params["DataTier"] = data_tier
-            
-        if workspace_id:
-            params["WorkspaceId"] = workspace_id
-            
-        if repository_id:
-            params["RepositoryId"] = repository_id
-            
-        if linkable is not None:
-            params["Linkable"] = str(linkable).lower()
-            
-        if linked is not None:
-            params["Linked"] = str(linked).lower()
-            
-        if locked is not None:
-            params["Locked"] = str(locked).lower()
-            
-        if is_sdk is not None:
-            params["IsSdk"] = str(is_sdk).lower()
-            
-        # Add pagination if provided
-        if page_number is not None:
-            params["PageNumber"] = page_number
-            
-        if page_size is not None:
-            params["PageSize"] = page_size
+        # Add filters and pagination if provided
+        filter_params = (
+            ("DataTier", data_tier),
+            ("WorkspaceId", workspace_id),
+            ("RepositoryId", repository_id),
+        )
+        bool_params = (
+            ("Linkable", linkable),
+            ("Linked", linked),
+            ("Locked", locked),
+            ("IsSdk", is_sdk),
+        )
+        page_params = (
+            ("PageNumber", page_number),
+            ("PageSize", page_size),
+        )
+        params = {k: v for k, v in filter_params if v}
+        params.update((k, _BOOL_STR[v]) for k, v in bool_params if v is not None)
+        params.update((k, v) for k, v in page_params if v is not None)
             
-        topics = await make_quix_request(
+        return await _conditional_get(
             ctx,
-            "GET",
-            "topics",
+            _workspace_cache_key("search_topics", tuple(sorted(params.items()))),
+            _format_topic_search,
+            path="topics",
             params=params
         )
+    except QuixApiError as e:
+        return f"Error searching topics: {str(e)}"
+
+def _format_linkable_topics(topics: Optional[List[Dict[str, Any]]]) -> str:
+    """Format the linkable topics list."""
+    if not topics:
+        return "No linkable topics found in this workspace."
         
-        if not topics:
-            return "No topics found matching the search criteria."
-            
-        result = "Topics found:\n\n"
-        for topic in topics:
-            result += f"Name: {topic.get('name')}\n"
-            result += f"ID: {topic.get('id')}\n"
-            result += f"Workspace ID: {topic.get('workspaceId')}\n"
+    parts = [_LINKABLE_TOPICS_HEADER]
+    for topic in topics:
+        get = topic.get
+        parts.append(f"Name: {get('name')}\nID: {get('id')}\n")
+        _render(parts, topic, _TOPIC_STATUS_FIELDS)
             
-            # Add status information
-            status = topic.get('status')
-            if status:
-                result += f"Status: {status}\n"
+        # Add linked topic info if present
+        linked_info = get('linkedTopicInfo')
+        if linked_info:
+            _render(parts, linked_info, _LINKABLE_TOPIC_LINKED_FIELDS)
                 
-            # Add data tier if present
-            data_tier = topic.get('dataTier')
-            if data_tier:
-                result += f"Data Tier: {data_tier}\n"
-                
-            # Add linked topic info if present
-            linked_info = topic.get('linkedTopicInfo')
-            if linked_info:
-                is_linked = linked_info.get('isLinked')
-                if is_linked:
-                    result += f"Is Linked: {is_linked}\n"
-                    
-                is_locked = linked_info.get('isLocked')
-                if is_locked:
-                    result += f"Is Locked: {is_locked}\n"
-                    
-                is_scratchpad = linked_info.get('isScratchpad')
-                if is_scratchpad:
-                    result += f"Is Scratchpad: {is_scratchpad}\n"
-                    
-                repository_name = linked_info.get('repositoryName')
-                if repository_name:
-                    result += f"Repository: {repository_name}\n"
-                    
-                environment_name = linked_info.get('environmentName')
-                if environment_name:
-                    result += f"Environment: {environment_name}\n"
-                    
-            result += "-" * 40 + "\n"
-            
-        return result
-    except QuixApiError as e:
-        return f"Error searching topics: {str(e)}"
+        parts.append(_TOPIC_SEPARATOR)
+        
+    return "".join(parts)
 
 @mcp.tool()
 async def get_linkable_topics(ctx: Context) -> str:
     """Get all linkable topics from your workspace.
     """
     try:
-        topics = await make_quix_request(
+        return await _conditional_get(
             ctx,
-            "GET",
-            "{workspaceId}/topics/all-linkable"
+            _workspace_cache_key("get_linkable_topics"),
+            _format_linkable_topics,
+            path_parts=("topics", "all-linkable")
         )
-        
-        if not topics:
-            return "No linkable topics found in this workspace."
-            
-        result = "Linkable Topics:\n\n"
-        for topic in topics:
-            result += f"Name: {topic.get('name')}\n"
-            result += f"ID: {topic.get('id')}\n"
-            
-            # Add status information
-            status = topic.get('status')
-            if status:
-                result += f"Status: {status}\n"
-                
-            # Add linked topic info if present
-            linked_info = topic.get('linkedTopicInfo')
-            if linked_info:
-                is_linked = linked_info.get('isLinked')
-                if is_linked:
-                    result += f"Is Linked: {is_linked}\n"
-                    
-                is_locked = linked_info.get('isLocked')
-                if is_locked:
-                    result += f"Is Locked: {is_locked}\n"
-                    
-                repository_name = linked_info.get('repositoryName')
-                if repository_name:
-                    result += f"Repository: {repository_name}\n"
-                    
-                environment_name = linked_info.get('environmentName')
-                if environment_name:
-                    result += f"Environment: {environment_name}\n"
-                    
-            result += "-" * 40 + "\n"
-            
-        return result
     except QuixApiError as e:
         return f"Error retrieving linkable topics: {str(e)}"
 
@@ -3657,7 +3752,7 @@ async def get_external_topics(ctx: Context) -> str:
         result = await make_quix_request(
             ctx,
             "GET",
-            "{workspaceId}/topics/external/import"
+            path_parts=("topics", "external", "import")
         )
         
         if not result:
@@ -3675,73 +3770,42 @@ async def check_imported_topics_refresh(ctx: Context) -> str:
         result = await make_quix_request(
             ctx,
             "GET",
-            "{workspaceId}/topics/external/import/refresh"
+            path_parts=("topics", "external", "import", "refresh")
         )
         
         if not result:
             return "No changes would occur from refreshing imported topics."
             
-        output = "Potential changes from refreshing imported topics:\n\n"
+        parts = [_REFRESH_CHECK_HEADER]
         
         # Handle changed topics
         changed_topics = result.get('changedTopics', [])
-        if changed_topics and len(changed_topics) > 0:
-            output += "Topics that would be changed:\n"
+        if changed_topics:
+            parts.append("Topics that would be changed:\n")
             
             for topic in changed_topics:
-                name = topic.get('name')
-                output += f"- {name}\n"
+                parts.append(f"- {topic.get('name')}\n")
                 
                 current_config = topic.get('currentConfig')
                 target_config = topic.get('targetConfig')
                 
                 if current_config and target_config:
-                    output += "  Changes:\n"
-                    
-                    # Compare partitions
-                    current_partitions = current_config.get('partitions')
-                    target_partitions = target_config.get('partitions')
-                    if current_partitions != target_partitions:
-                        output += f"    Partitions: {current_partitions} -> {target_partitions}\n"
+                    parts.append("  Changes:\n")
+                    _render_config_diff(parts, current_config, target_config)
                         
-                    # Compare replication factor
-                    current_replication = current_config.get('replicationFactor')
-                    target_replication = target_config.get('replicationFactor')
-                    if current_replication != target_replication:
-                        output += f"    Replication Factor: {current_replication} -> {target_replication}\n"
-                        
-                    # Compare retention in minutes
-                    current_retention_mins = current_config.get('retentionInMinutes')
-                    target_retention_mins = target_config.get('retentionInMinutes')
-                    if current_retention_mins != target_retention_mins:
-                        output += f"    Retention (minutes): {current_retention_mins} -> {target_retention_mins}\n"
-                        
-                    # Compare retention in bytes
-                    current_retention_bytes = current_config.get('retentionInBytes')
-                    target_retention_bytes = target_config.get('retentionInBytes')
-                    if current_retention_bytes != target_retention_bytes:
-                        output += f"    Retention (bytes): {current_retention_bytes} -> {target_retention_bytes}\n"
-                        
-                    # Compare cleanup policy
-                    current_cleanup = current_config.get('cleanupPolicy')
-                    target_cleanup = target_config.get('cleanupPolicy')
-                    if current_cleanup != target_cleanup:
-                        output += f"    Cleanup Policy: {current_cleanup} -> {target_cleanup}\n"
-                        
-            output += "\n"
+            parts.append("\n")
             
         # Handle deleted topics
         deleted_topics = result.get('deletedTopics', [])
-        if deleted_topics and len(deleted_topics) > 0:
-            output += "Topics that would be deleted:\n"
+        if deleted_topics:
+            parts.append("Topics that would be deleted:\n")
             
             for topic in deleted_topics:
-                name = topic.get('name')
-                output += f"- {name}\n"
+                parts.append(f"- {topic.get('name')}\n")
                 
-            output += "\n"
+            parts.append("\n")
             
-        return output
+        return "".join(parts)
     except QuixApiError as e:
         return f"Error checking imported topics refresh: {str(e)}"
 
@@ -3753,128 +3817,103 @@ async def refresh_imported_topics(ctx: Context) -> str:
         result = await make_quix_request(
             ctx,
             "POST",
-            "{workspaceId}/topics/external/import/refresh"
+            path_parts=("topics", "external", "import", "refresh")
         )
         
         if not result:
             return "No changes occurred from refreshing imported topics."
             
-        output = "Changes from refreshing imported topics:\n\n"
+        parts = [_REFRESH_HEADER]
         
         # Handle changed topics
         changed_topics = result.get('changedTopics', [])
-        if changed_topics and len(changed_topics) > 0:
-            output += "Topics that were changed:\n"
+        if changed_topics:
+            parts.append("Topics that were changed:\n")
             
             for topic in changed_topics:
-                name = topic.get('name')
-                output += f"- {name}\n"
+                parts.append(f"- {topic.get('name')}\n")
                 
                 current_config = topic.get('currentConfig')
                 target_config = topic.get('targetConfig')
                 
                 if current_config and target_config:
-                    output += "  Changes:\n"
-                    
-                    # Compare partitions
-                    current_partitions = current_config.get('partitions')
-                    target_partitions = target_config.get('partitions')
-                    if current_partitions != target_partitions:
-                        output += f"    Partitions: {current_partitions} -> {target_partitions}\n"
-                        
-                    # Compare replication factor
-                    current_replication = current_config.get('replicationFactor')
-                    target_replication = target_config.get('replicationFactor')
-                    if current_replication != target_replication:
-                        output += f"    Replication Factor: {current_replication} -> {target_replication}\n"
-                        
-                    # Compare retention in minutes
-                    current_retention_mins = current_config.get('retentionInMinutes')
-                    target_retention_mins = target_config.get('retentionInMinutes')
-                    if current_retention_mins != target_retention_mins:
-                        output += f"    Retention (minutes): {current_retention_mins} -> {target_retention_mins}\n"
-                        
-                    # Compare retention in bytes
-                    current_retention_bytes = current_config.get('retentionInBytes')
-                    target_retention_bytes = target_config.get('retentionInBytes')
-                    if current_retention_bytes != target_retention_bytes:
-                        output += f"    Retention (bytes): {current_retention_bytes} -> {target_retention_bytes}\n"
+                    parts.append("  Changes:\n")
+                    _render_config_diff(parts, current_config, target_config)
                         
-                    # Compare cleanup policy
-                    current_cleanup = current_config.get('cleanupPolicy')
-                    target_cleanup = target_config.get('cleanupPolicy')
-                    if current_cleanup != target_cleanup:
-                        output += f"    Cleanup Policy: {current_cleanup} -> {target_cleanup}\n"
-                        
-            output += "\n"
+            parts.append("\n")
             
         # Handle deleted topics
         deleted_topics = result.get('deletedTopics', [])
-        if deleted_topics and len(deleted_topics) > 0:
-            output += "Topics that were deleted:\n"
+        if deleted_topics:
+            parts.append("Topics that were deleted:\n")
             
             for topic in deleted_topics:
-                name = topic.get('name')
-                output += f"- {name}\n"
+                parts.append(f"- {topic.get('name')}\n")
                 
-            output += "\n"
+            parts.append("\n")
             
-        return output
+        return "".join(parts)
     except QuixApiError as e:
         return f"Error refreshing imported topics: {str(e)}"
 
+def _format_topic_metrics(metrics: Optional[List[Dict[str, Any]]]) -> str:
+    """Format the metrics of all topics."""
+    if not metrics:
+        return "No topic metrics available."
+        
+    parts = [_TOPIC_METRICS_HEADER]
+    for metric in metrics:
+        _render(parts, metric, _TOPIC_METRIC_FIELDS)
+            
+        # Streams metrics
+        streams_persisted = metric.get('streamsPersisted')
+        if streams_persisted:
+            parts.append("Streams Persisted:\n")
+            for stream_id, values in streams_persisted.items():
+                parts.append(f"  {stream_id}: {values} values/sec\n")
+                
+        parts.append(_TOPIC_SEPARATOR)
+        
+    return "".join(parts)
+
 @mcp.tool()
 async def get_topic_metrics(ctx: Context) -> str:
     """Get metrics for all topics in your workspace.
     """
     try:
-        metrics = await make_quix_request(
+        return await _conditional_get(
             ctx,
-            "GET",
-            "{workspaceId}/topics/metrics/all"
+            _workspace_cache_key("get_topic_metrics"),
+            _format_topic_metrics,
+            path_parts=("topics", "metrics", "all")
         )
-        
-        if not metrics:
-            return "No topic metrics available."
-            
-        result = "Topic Metrics:\n\n"
-        for metric in metrics:
-            topic_id = metric.get('topicId')
-            if topic_id:
-                result += f"Topic ID: {topic_id}\n"
-                
-            # Core metrics
-            bytes_in = metric.get('bytesInPerSecond')
-            if bytes_in is not None:
-                result += f"Bytes In/sec: {bytes_in}\n"
-                
-            bytes_out = metric.get('bytesOutPerSecond')
-            if bytes_out is not None:
-                result += f"Bytes Out/sec: {bytes_out}\n"
-                
-            values_persisted = metric.get('valuesPersistedPerSecond')
-            if values_persisted is not None:
-                result += f"Values Persisted/sec: {values_persisted}\n"
-                
-            # Streams metrics
-            streams_persisted = metric.get('streamsPersisted')
-            if streams_persisted and len(streams_persisted) > 0:
-                result += "Streams Persisted:\n"
-                for stream_id, values in streams_persisted.items():
-                    result += f"  {stream_id}: {values} values/sec\n"
-                    
-            result += "-" * 40 + "\n"
-            
-        return result
     except QuixApiError as e:
         return f"Error retrieving topic metrics: {str(e)}"
 
+@mcp.tool()
+async def get_workspace_overview(ctx: Context) -> str:
+    """Get linkable topics, external topics, pending imported topic changes and topic metrics in one call.
+    """
+    # The sections are independent, so fetch them concurrently; each tool reports its own errors
+    sections = await asyncio.gather(
+        get_linkable_topics(ctx),
+        get_external_topics(ctx),
+        check_imported_topics_refresh(ctx),
+        get_topic_metrics(ctx)
+    )
+    
+    return "\n\n".join(section.rstrip("\n") for section in sections) + "\n"
+
 
 def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlette:
     """Create a Starlette application that can serve the provided mcp server with SSE."""
     sse = SseServerTransport("/messages/")
+    # The options are the same for every connection, so build them once
+    init_options = mcp_server.create_initialization_options()
 
     async def handle_sse(request: Request) -> None:
+        # Starlette has no public accessor for the raw ASGI send callable
+        # that the SSE transport writes to, so use the request's own
         async with sse.connect_sse(
                 request.scope,
                 request.receive,
@@ -3883,17 +3922,25 @@ def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlett
             await mcp_server.run(
                 read_stream,
                 write_stream,
-                mcp_server.create_initialization_options(),
+                init_options,
             )
 
+    @asynccontextmanager
+    async def lifespan(app: Starlette):
+        yield
+        await close_http_client()
+
     return Starlette(
         debug=debug,
         routes=[
             Route("/sse", endpoint=handle_sse),
             Mount("/messages/", app=sse.handle_post_message),
         ],
+        lifespan=lifespan,
     )
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
     # Load configuration
     config = load_config()
     
@@ -3905,12 +3952,23 @@ if __name__ == "__main__":
     if config['quix_workspace']:
         os.environ['QUIX_WORKSPACE'] = config['quix_workspace']
     
+    # Validate the API settings once up front; requests reuse the cached values
+    try:
+        _api_settings()
+    except QuixApiError as e:
+        logger.error("%s", e)
+        raise SystemExit(1)
+    
     # Initialize and start the server
     mcp_server = mcp._mcp_server
     starlette_app = create_starlette_app(mcp_server, debug=config['debug'])
     
-    logger.info(f"Starting Quix Applications MCP server on {config['host']}:{config['port']}")
-    logger.info(f"Using Quix Portal at {config['quix_base_url']}")
-    logger.info(f"Using Quix Workspace {config['quix_workspace']}")
+    logger.info("Starting Quix Applications MCP server on %s:%s", config['host'], config['port'])
+    logger.info("Using Quix Portal at %s", config['quix_base_url'])
+    logger.info("Using Quix Workspace %s", config['quix_workspace'])
+    
+    # Imported here so importing the module (or a failed config check) skips it
+    import uvicorn
     
+    # uvicorn's default "auto" loop and http settings pick uvloop and httptools when installed
     uvicorn.run(starlette_app, host=config['host'], port=config['port'])
\ No newline at end of file
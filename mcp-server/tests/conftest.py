@@ -0,0 +1,35 @@
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+BASE_URL = "https://portal.example.io/"
+
+
+def _reset():
+    main._api_settings.cache_clear()
+    main._response_cache.clear()
+    main._inflight_gets.clear()
+    main._app_variables_cache.clear()
+    main._etag_responses.clear()
+    main._HTTP_CLIENT = None
+
+
+@pytest.fixture
+def quix_api(monkeypatch):
+    """Route the shared HTTP client to a handler(request) -> httpx.Response."""
+    monkeypatch.setenv("QUIX_TOKEN", "token")
+    monkeypatch.setenv("QUIX_BASE_URL", BASE_URL)
+    monkeypatch.setenv("QUIX_WORKSPACE", "ws1")
+    _reset()
+
+    def install(handler):
+        main._HTTP_CLIENT = httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(handler))
+
+    yield install
+    _reset()
@@ -0,0 +1,32 @@
+import asyncio
+
+from cache import TTLCache
+
+
+def test_waiters_retry_when_owner_is_cancelled():
+    async def scenario():
+        cache = TTLCache()
+        calls = []
+        started = asyncio.Event()
+
+        async def factory():
+            calls.append(len(calls))
+            if len(calls) == 1:
+                started.set()
+                await asyncio.sleep(10)
+            return "fresh"
+
+        owner = asyncio.create_task(cache.get_or_set("key", 60, factory))
+        await started.wait()
+        waiters = [asyncio.create_task(cache.get_or_set("key", 60, factory)) for _ in range(2)]
+        await asyncio.sleep(0)
+        owner.cancel()
+
+        results = await asyncio.gather(*waiters)
+        assert owner.cancelled()
+        return results, calls
+
+    results, calls = asyncio.run(scenario())
+    assert results == ["fresh", "fresh"]
+    # One waiter takes over the call and the other shares its result
+    assert len(calls) == 2
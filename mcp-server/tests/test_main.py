@@ -0,0 +1,84 @@
+import asyncio
+
+import httpx
+import orjson
+
+import main
+
+
+def test_conditional_get_wraps_non_json_body(quix_api):
+    quix_api(lambda request: httpx.Response(
+        200, content=b"<html>Bad gateway</html>", headers={"content-type": "text/html"}
+    ))
+
+    result = asyncio.run(main.get_topics(None))
+
+    assert result.startswith("Error: Invalid JSON in API response")
+
+
+def test_topics_missing_fields_render_as_none(quix_api):
+    quix_api(lambda request: httpx.Response(200, json=[{"name": "orders", "status": "Ready"}]))
+
+    compact = asyncio.run(main.get_topics(None))
+    main._response_cache.clear()
+    main._etag_responses.clear()
+    verbose = asyncio.run(main.get_topics(None, verbose=True))
+
+    assert "orders\tNone\tReady\t\n" in compact
+    assert "Name: orders\nID: None\n" in verbose
+
+
+def test_make_quix_request_decodes_text_with_declared_charset(quix_api):
+    quix_api(lambda request: httpx.Response(
+        200, content="café log".encode("latin-1"), headers={"content-type": "text/plain; charset=iso-8859-1"}
+    ))
+
+    assert asyncio.run(main.make_quix_request(None, "GET", path_parts=("logs",))) == "café log"
+
+
+def test_make_quix_request_tolerates_non_utf8_binary(quix_api):
+    quix_api(lambda request: httpx.Response(
+        200, content=b"ok \xff\xfe", headers={"content-type": "application/octet-stream"}
+    ))
+
+    assert asyncio.run(main.make_quix_request(None, "GET", path_parts=("files",))) == "ok ��"
+
+
+def test_compact_topics_render_null_status_as_blank(quix_api):
+    quix_api(lambda request: httpx.Response(200, json=[{"name": "orders", "id": "t1", "status": None}]))
+
+    assert "orders\tt1\t\t\n" in asyncio.run(main.get_topics(None))
+
+
+def test_consecutive_variable_adds_keep_earlier_ones(quix_api):
+    server = {"variables": [{"name": "A", "inputType": "FreeText", "required": False}]}
+
+    def handler(request):
+        if request.method == "PATCH":
+            server["variables"] = orjson.loads(request.content)["variables"]
+            # The PATCH response does not echo the variables back
+            return httpx.Response(200, json={"applicationId": "app1", "name": "app"})
+        return httpx.Response(200, json={"applicationId": "app1", "name": "app", **server})
+
+    quix_api(handler)
+
+    async def scenario():
+        await main.add_application_variable(None, "app1", "B", "FreeText")
+        await main.add_application_variable(None, "app1", "C", "FreeText")
+
+    asyncio.run(scenario())
+
+    assert [var["name"] for var in server["variables"]] == ["A", "B", "C"]
+
+
+def test_add_application_variables_rejects_empty_and_duplicate_lists(quix_api):
+    requests = []
+    quix_api(lambda request: requests.append(request) or httpx.Response(500))
+    variable = {"name": "B", "inputType": "FreeText", "required": False}
+
+    empty = asyncio.run(main.add_application_variables(None, "app1", []))
+    duplicate = asyncio.run(main.add_application_variables(None, "app1", [variable, dict(variable)]))
+
+    assert empty.startswith("Error: No variables given")
+    assert duplicate.startswith("Error: Variable 'B' is given more than once")
+    assert not requests
@@ -1,14 +1,83 @@
-import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, HAVE_CEXT, errorcode
+from mysql.connector.pooling import MySQLConnectionPool
 from quixstreams import Application
 from quixstreams.sinks import BatchingSink, SinkBatch, SinkBackpressureError
-import json
+import datetime
+import logging
 import os
+import re
+from operator import itemgetter
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+logger = logging.getLogger(__name__)
+
+# Rows per multi-row INSERT, keeping each statement well under max_allowed_packet
+INSERT_CHUNK_SIZE = 1000
+
+# Batches at least this large are bulk loaded with LOAD DATA LOCAL INFILE
+LOAD_DATA_MIN_ROWS = 500
+
+# Attempts, and seconds between them, to open the connection pool on the first write
+POOL_CONNECT_ATTEMPTS = 3
+POOL_CONNECT_DELAY = 3
+
+# Errors meaning the server or client refuses LOAD DATA LOCAL INFILE altogether
+_LOCAL_INFILE_REFUSED = frozenset((
+    errorcode.ER_NOT_ALLOWED_COMMAND,
+    errorcode.ER_CLIENT_LOCAL_FILES_DISABLED,
+    errorcode.CR_LOAD_DATA_LOCAL_INFILE_REJECTED,
+))
+
+
+# Column names that suggest a timestamp value
+_TS_COL_RE = re.compile(r'time|date|timestamp', re.I)
+
+# SQL column types by exact Python type; bool is listed separately from int
+_SQL_TYPES = {bool: 'BOOLEAN', int: 'INT', float: 'FLOAT'}
+
+
+def _infer_sql_type(col, value):
+    # Handle None values
+    if value is None:
+        return "VARCHAR(255) NULL"
+    
+    # Handle numeric and boolean types
+    sql_type = _SQL_TYPES.get(type(value))
+    if sql_type:
+        return sql_type
+    
+    # Handle timestamp-like strings
+    if isinstance(value, str) and _TS_COL_RE.search(col):
+        try:
+            datetime.datetime.strptime(value, '%Y-%m-%d %H:%M:%S.%f')
+            return "TIMESTAMP"
+        except ValueError:
+            # If not a valid timestamp, treat as regular string
+            pass
+    
+    # Handle strings and other types as strings
+    return "VARCHAR(255)"
+
+
+def _csv_field(value):
+    # Quote strings (doubling embedded quotes) so a literal "NULL" stays a string
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (int, float)):
+        return str(value)
+    return '"' + str(value).replace('"', '""') + '"'
+
 
 class MySQLSink(BatchingSink):
-    def __init__(self, host, database, user, password):
+    def __init__(self, host, database, user, password, max_workers=4):
         super().__init__()
+        # Each writer thread holds its own pooled connection
+        self._local = threading.local()
         self.host = host
         self.database = database
         self.user = user
@@ -16,116 +85,224 @@ class MySQLSink(BatchingSink):
         self.connection = None
         self.table_name = None
         self.columns = None
+        self._column_set = None
+        self._row_getter = None
+        self._insert_sql = None
+        self._row_placeholders = None
+        self._full_chunk_sql = None
+        self._load_data_sql = None
+        # Cleared if the server refuses LOAD DATA LOCAL INFILE. Read and written
+        # without _table_lock: it only ever goes from True to False, so a writer
+        # that reads it just before another clears it merely tries LOAD DATA for
+        # one more batch and falls back to INSERT
+        self.local_infile = True
+        # Only one thread may create the table on the first write
+        self._table_lock = threading.Lock()
+        # Batches of different partitions are written concurrently on flush
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mysql-sink")
+        if not HAVE_CEXT:
+            logger.warning("MySQL C extension not available, falling back to the slower pure Python protocol")
+        # Only the executor threads write, so one connection per worker is enough
+        self._pool_size = max_workers
+        # Opened on the first write, so the sink starts even if MySQL is not up yet
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self):
+        # Open the connections once; each batch borrows one instead of reconnecting
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = self._open_pool()
+        return self._pool
+
+    def _open_pool(self):
+        attempts_remaining = POOL_CONNECT_ATTEMPTS
+        while True:
+            try:
+                return MySQLConnectionPool(
+                    pool_name="quix",
+                    pool_size=self._pool_size,
+                    host=self.host,
+                    database=self.database,
+                    user=self.user,
+                    password=self.password,
+                    autocommit=False,
+                    use_pure=False,
+                    # Compress the wire protocol; the generated schemas are VARCHAR heavy
+                    compress=True,
+                    # Only the temporary CSV files written by _load_data may be sent
+                    allow_local_infile_in_path=tempfile.gettempdir()
+                )
+            except Error as e:
+                attempts_remaining -= 1
+                if not attempts_remaining:
+                    raise
+                logger.warning("Error connecting to MySQL, retrying: %s", e)
+                time.sleep(POOL_CONNECT_DELAY)
+
+    @property
+    def connection(self):
+        return getattr(self._local, "connection", None)
+
+    @connection.setter
+    def connection(self, value):
+        self._local.connection = value
+
+    @property
+    def cursor(self):
+        return getattr(self._local, "cursor", None)
+
+    @cursor.setter
+    def cursor(self, value):
+        self._local.cursor = value
 
     def _connect_to_mysql(self):
         try:
-            self.connection = mysql.connector.connect(
-                host=self.host,
-                database=self.database,
-                user=self.user,
-                password=self.password
-            )
-            if self.connection.is_connected():
-                return True
+            self.connection = self._get_pool().get_connection()
+            # Pooled connections may have been dropped by the server since their last use
+            self.connection.ping(reconnect=True, attempts=3, delay=1)
+            # One cursor serves table creation and the inserts for the whole batch
+            self.cursor = self.connection.cursor()
+            return True
         except Error as e:
-            print(f"Error connecting to MySQL: {e}")
+            logger.error("Error connecting to MySQL: %s", e)
             return False
 
-    def _create_table(self, data):
-        if not self._connect_to_mysql():
-            return False
+    def _release_connection(self):
+        if self.cursor is not None:
+            try:
+                self.cursor.close()
+            except Error:
+                # The connection is gone; the pool reconnects it on the next ping
+                pass
+            self.cursor = None
+        # Closing a pooled connection returns it to the pool
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
 
+    def _create_table(self, data):
         try:
-            cursor = self.connection.cursor()
+            cursor = self.cursor
             
             # Get the first message to determine the data structure
             sample_data = data[0]
             self.columns = list(sample_data.keys())  # Ensure ordered columns
+            self._column_set = set(self.columns)
+            # itemgetter returns a bare value rather than a tuple for a single column
+            getter = itemgetter(*self.columns)
+            self._row_getter = getter if len(self.columns) > 1 else lambda record: (getter(record),)
             
             # Create table name based on topic
-            self.table_name = f"kafka_{int(time.time())}"
+            table_name = f"kafka_{int(time.time())}"
             
             # Create table with appropriate data types
-            columns_sql = []
-            for col in self.columns:
-                # Get the first value to determine type
-                value = sample_data[col]
-                
-                # Handle None values
-                if value is None:
-                    columns_sql.append(f"{col} VARCHAR(255) NULL")
-                    continue
-                
-                # Handle numeric types
-                if isinstance(value, (int, float)):
-                    if isinstance(value, int):
-                        columns_sql.append(f"{col} INT")
-                    else:
-                        columns_sql.append(f"{col} FLOAT")
-                # Handle boolean
-                elif isinstance(value, bool):
-                    columns_sql.append(f"{col} BOOLEAN")
-                # Handle string types
-                elif isinstance(value, str):
-                    # Handle timestamp-like strings
-                    if any(word in col.lower() for word in ['time', 'date', 'timestamp']):
-                        try:
-                            # Try to parse as datetime
-                            import datetime
-                            datetime.datetime.strptime(value, '%Y-%m-%d %H:%M:%S.%f')
-                            columns_sql.append(f"{col} TIMESTAMP")
-                        except (ValueError, TypeError):
-                            # If not a valid timestamp, treat as regular string
-                            columns_sql.append(f"{col} VARCHAR(255)")
-                    else:
-                        columns_sql.append(f"{col} VARCHAR(255)")
-                # Handle other types as strings
-                else:
-                    columns_sql.append(f"{col} VARCHAR(255)")
+            # The first value of each column determines its type
+            columns_sql = [f"{col} {_infer_sql_type(col, sample_data[col])}" for col in self.columns]
             
-            create_table_sql = f"CREATE TABLE IF NOT EXISTS {self.table_name} (" + \
+            create_table_sql = f"CREATE TABLE IF NOT EXISTS {table_name} (" + \
                              ", ".join(columns_sql) + \
                              ", id INT AUTO_INCREMENT PRIMARY KEY)"
             
             cursor.execute(create_table_sql)
             self.connection.commit()
-            print(f"Created table: {self.table_name}")
+            logger.info("Created table: %s", table_name)
+            
+            # The column list is fixed from here on, so build the write statements once
+            columns = ", ".join(self.columns)
+            self._insert_sql = f"INSERT INTO {table_name} ({columns}) VALUES "
+            self._row_placeholders = "(" + ", ".join(["%s"] * len(self.columns)) + ")"
+            self._full_chunk_sql = self._insert_sql + ", ".join([self._row_placeholders] * INSERT_CHUNK_SIZE)
+            self._load_data_sql = (
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE {table_name} "
+                "CHARACTER SET utf8mb4 "
+                "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+                "LINES TERMINATED BY '\\n' "
+                f"({columns})"
+            )
+            # Publish the table last, so other writer threads only see it fully set up
+            self.table_name = table_name
             return True
         except Error as e:
-            print(f"Error creating table: {e}")
+            logger.error("Error creating table: %s", e)
             return False
 
+    def _load_data(self, cursor, values):
+        # Stream the batch through a temporary CSV file; the server parses it in one pass
+        path = None
+        try:
+            with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, encoding="utf-8") as f:
+                path = f.name
+                for row in values:
+                    f.write(",".join(_csv_field(v) for v in row) + "\n")
+            cursor.execute(self._load_data_sql, (path,))
+            # LOCAL loads act as if IGNORE were given, truncating or zeroing bad values
+            # with only a warning; INSERT rejects those rows under strict mode instead
+            if cursor.warning_count:
+                logger.warning(
+                    "LOAD DATA LOCAL INFILE reported %d warnings, inserting this batch instead",
+                    cursor.warning_count
+                )
+                self.connection.rollback()
+                return False
+            return True
+        except Error as e:
+            if e.errno in _LOCAL_INFILE_REFUSED:
+                logger.warning("LOAD DATA LOCAL INFILE unavailable, falling back to INSERT: %s", e)
+                self.local_infile = False
+            else:
+                logger.warning("LOAD DATA LOCAL INFILE failed, inserting this batch instead: %s", e)
+            return False
+        except (OSError, UnicodeError) as e:
+            # e.g. a full or unwritable temp dir, or a lone surrogate in a string value
+            logger.warning("Could not write the LOAD DATA file, inserting this batch instead: %s", e)
+            return False
+        finally:
+            if path is not None:
+                os.unlink(path)
+
     def _write_to_mysql(self, data):
+        if not self._connect_to_mysql():
+            return False
+
         if not self.table_name:
-            if not self._create_table(data):
-                return False
+            with self._table_lock:
+                if not self.table_name and not self._create_table(data):
+                    return False
 
         try:
-            cursor = self.connection.cursor()
-            
-            # Prepare INSERT statement
-            placeholders = ", ".join("%s" for _ in self.columns)
-            columns = ", ".join(self.columns)
-            insert_sql = f"INSERT INTO {self.table_name} ({columns}) VALUES ({placeholders})"
+            cursor = self.cursor
             
-            # Convert all data to tuples
-            values = []
-            for item in data:
-                # Data is a flat dictionary
-                record = item
-                # Get values in the same order as columns
-                row_values = tuple(record.get(col, None) for col in self.columns)
-                values.append(row_values)
+            # Convert all data to tuples, in the same order as columns;
+            # records missing a column get NULL for it
+            row_getter = self._row_getter
+            column_set = self._column_set
+            values = [
+                row_getter(record) if column_set <= record.keys()
+                else tuple(record.get(col) for col in self.columns)
+                for record in data
+            ]
             
-
-            print(values[2::])
-            # Execute batch insert
-            cursor.executemany(insert_sql, values)
+            loaded = (
+                self.local_infile
+                and len(values) >= LOAD_DATA_MIN_ROWS
+                and self._load_data(cursor, values)
+            )
+            if not loaded:
+                # Insert each chunk with a single multi-row statement
+                for start in range(0, len(values), INSERT_CHUNK_SIZE):
+                    chunk = values[start:start + INSERT_CHUNK_SIZE]
+                    if len(chunk) == INSERT_CHUNK_SIZE:
+                        chunk_sql = self._full_chunk_sql
+                    else:
+                        chunk_sql = self._insert_sql + ", ".join([self._row_placeholders] * len(chunk))
+                    cursor.execute(chunk_sql, tuple(v for row in chunk for v in row))
             self.connection.commit()
-            print(f"Inserted {len(values)} records into {self.table_name}")
+            logger.debug("Inserted %d records into %s", len(values), self.table_name)
             return True
         except Error as e:
-            print(f"Error writing to MySQL: {e}")
+            logger.error("Error writing to MySQL: %s", e)
             return False
 
     def write(self, batch: SinkBatch):
@@ -145,9 +322,28 @@ class MySQLSink(BatchingSink):
                     topic=batch.topic,
                     partition=batch.partition,
                 )
+            finally:
+                self._release_connection()
         raise Exception("Error while writing to MySQL")
 
+    def flush(self):
+        # Overrides quixstreams.sinks.BatchingSink.flush (quixstreams 3.13.1, as pinned
+        # in requirements.txt), which writes the batches one after another; the
+        # batches are still cleared afterwards whether or not a write failed
+        try:
+            # Overlap the MySQL round-trips of every partition's batch
+            futures = [self._executor.submit(self.write, batch) for batch in self._batches.values()]
+            wait(futures)
+            # Surface the first failure (e.g. backpressure) once all writes have finished
+            for future in futures:
+                future.result()
+        finally:
+            # Always drop batches after flushing
+            self._batches.clear()
+
 def main():
+    logging.basicConfig(level=logging.INFO)
+
     # MySQL connection details
     mysql_config = {
         "host": os.environ["mysql_server"],
@@ -167,7 +363,8 @@ def main():
     mysql_sink = MySQLSink(**mysql_config)
     
     # Get the input topic from environment variable
-    input_topic = app.topic(name=os.getenv("input", "default_topic"))
+    # Values are decoded to dicts by the topic deserializer, so the sink never parses JSON
+    input_topic = app.topic(name=os.getenv("input", "default_topic"), value_deserializer="json")
     sdf = app.dataframe(topic=input_topic)
     
     # Process the data